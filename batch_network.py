@@ -0,0 +1,192 @@
+import numpy as np
+from neat.graphs import feed_forward_layers
+
+# Códigos das funções de ativação suportadas (activation_options do config.txt)
+ACTIVATIONS = ('sigmoid', 'relu', 'tanh')
+
+
+class BatchNetwork:
+    """Todas as redes de uma geração avaliadas juntas com NumPy
+
+    Equivalente a um neat.nn.FeedForwardNetwork por genoma, mas cada tick
+    recebe uma matriz de entradas (N, num_inputs) e devolve uma matriz de
+    saídas (N, num_outputs). Os nós de cada camada topológica são
+    preenchidos (padding) até o maior tamanho entre os genomas, e as somas
+    são acumuladas na mesma ordem das conexões de neat, então o resultado
+    só difere do neat no último bit de exp/tanh.
+
+    Colunas da matriz de valores de cada genoma:
+        0 .. num_inputs-1                 entradas
+        num_inputs .. + num_outputs - 1   saídas
+        seguintes                         nós ocultos
+        última coluna                     descarte para o padding
+    """
+
+    def __init__(self, size, num_inputs, num_outputs, num_slots, layers):
+        self.size = size
+        self.num_inputs = num_inputs
+        self.num_outputs = num_outputs
+        self.num_slots = num_slots
+        # Cada camada: (slot, activation, bias, response, source, weight)
+        self.layers = layers
+
+        # Camadas recortadas para um subconjunto de linhas (dinossauros vivos)
+        self._rows = None
+        self._row_layers = layers
+
+        # Matriz de valores e índices de linha reaproveitados entre ticks
+        self._values = None
+        self._row_index = None
+
+    @staticmethod
+    def create(genomes, config):
+        """Compila os genomas de uma geração (mesma lógica de FeedForwardNetwork.create)"""
+        genome_config = config.genome_config
+        input_keys = genome_config.input_keys
+        output_keys = genome_config.output_keys
+        num_inputs = len(input_keys)
+        num_outputs = len(output_keys)
+
+        # Para cada genoma: lista de camadas, cada uma com (slot, act, bias, response, links)
+        compiled = []
+        num_slots = num_inputs + num_outputs
+        for genome in genomes:
+            slots = {key: i for i, key in enumerate(input_keys)}
+            slots.update({key: num_inputs + i for i, key in enumerate(output_keys)})
+
+            connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+            layers = []
+            for layer in feed_forward_layers(input_keys, output_keys, connections):
+                nodes = []
+                for node in layer:
+                    if node not in slots:
+                        slots[node] = len(slots)
+                    links = [(inode, genome.connections[(inode, onode)].weight)
+                             for inode, onode in connections if onode == node]
+                    ng = genome.nodes[node]
+                    if ng.activation not in ACTIVATIONS:
+                        raise ValueError(f"Ativação não suportada: {ng.activation}")
+                    nodes.append((node, ACTIVATIONS.index(ng.activation), ng.bias, ng.response, links))
+                layers.append(nodes)
+
+            compiled.append((slots, layers))
+            num_slots = max(num_slots, len(slots))
+
+        # Uma coluna extra recebe as escritas dos nós de padding
+        dummy = num_slots
+        num_slots += 1
+
+        size = len(compiled)
+        depth = max((len(layers) for _, layers in compiled), default=0)
+        batched = []
+        for depth_index in range(depth):
+            layer_nodes = [layers[depth_index] if depth_index < len(layers) else []
+                           for _, layers in compiled]
+            width = max(len(nodes) for nodes in layer_nodes)
+            fan_in = max((len(links) for nodes in layer_nodes for *_, links in nodes), default=1)
+
+            slot = np.full((size, width), dummy, dtype=np.int32)
+            activation = np.zeros((size, width), dtype=np.int8)
+            bias = np.zeros((size, width))
+            response = np.zeros((size, width))
+            source = np.full((size, width, fan_in), dummy, dtype=np.int32)
+            weight = np.zeros((size, width, fan_in))
+
+            for row, ((slots, _), nodes) in enumerate(zip(compiled, layer_nodes)):
+                for column, (node, act, node_bias, node_response, links) in enumerate(nodes):
+                    slot[row, column] = slots[node]
+                    activation[row, column] = act
+                    bias[row, column] = node_bias
+                    response[row, column] = node_response
+                    for k, (inode, w) in enumerate(links):
+                        source[row, column, k] = slots[inode]
+                        weight[row, column, k] = w
+
+            batched.append((slot, activation, bias, response, source, weight))
+
+        return BatchNetwork(size, num_inputs, num_outputs, num_slots, batched)
+
+    def rows(self, start, stop):
+        """Redes das linhas start..stop-1 (visões das mesmas matrizes, sem cópia)"""
+        layers = [tuple(array[start:stop] for array in layer) for layer in self.layers]
+        return BatchNetwork(stop - start, self.num_inputs, self.num_outputs, self.num_slots, layers)
+
+    def select(self, rows):
+        """Restringe a avaliação às linhas dadas (recorta as camadas uma vez)"""
+        if self._rows is not None and len(self._rows) == len(rows) and (self._rows == rows).all():
+            return
+        self._rows = rows.copy()
+        self._row_layers = [tuple(array[rows] for array in layer) for layer in self.layers]
+
+    def activate(self, inputs, rows=None):
+        """Avalia as redes: inputs (R, num_inputs) -> saídas (R, num_outputs)
+
+        Sem rows, avalia todos os genomas; com rows, só os índices dados.
+        As saídas são uma visão de um buffer reaproveitado: valem até a
+        próxima chamada.
+        """
+        if rows is None:
+            layers = self.layers
+        else:
+            self.select(rows)
+            layers = self._row_layers
+        return self._forward(inputs, layers, self._buffers(len(inputs)))
+
+    def _buffers(self, count):
+        """Matriz de valores zerada e índices de linha para `count` redes
+
+        Alocados uma vez com a população inteira; a cada tick só a parte
+        das linhas vivas é usada.
+        """
+        if self._values is None or len(self._values) < count:
+            capacity = max(count, self.size)
+            self._values = np.empty((capacity, self.num_slots))
+            self._row_index = np.arange(capacity)[:, None]
+        values = self._values[:count]
+        values.fill(0.0)
+        return values, self._row_index[:count]
+
+    def activate_ticks(self, tick_inputs, rows):
+        """Avalia as linhas dadas em vários ticks de uma vez
+
+        tick_inputs (T, num_inputs) tem uma linha de entradas por tick, a
+        mesma para todas as redes; devolve as saídas (T, len(rows), num_outputs).
+        Cada linha é calculada exatamente como em activate.
+        """
+        self.select(rows)
+        ticks = len(tick_inputs)
+        layers = [tuple(np.tile(array, (ticks,) + (1,) * (array.ndim - 1)) for array in layer)
+                  for layer in self._row_layers]
+        inputs = np.repeat(tick_inputs, len(rows), axis=0)
+        return self._forward(inputs, layers).reshape(ticks, len(rows), self.num_outputs)
+
+    def _forward(self, inputs, layers, buffers=None):
+        """Propaga as entradas pelas camadas (uma linha por rede)"""
+        count = len(inputs)
+        if buffers is None:
+            values = np.zeros((count, self.num_slots))
+            row_index = np.arange(count)[:, None]
+        else:
+            values, row_index = buffers
+        values[:, :self.num_inputs] = inputs
+
+        for slot, activation, bias, response, source, weight in layers:
+            # Soma ponderada na mesma ordem de neat (0 + v0*w0 + v1*w1 + ...)
+            linked = values[row_index[:, :, None], source] * weight
+            total = np.zeros(slot.shape)
+            for k in range(linked.shape[2]):
+                total += linked[:, :, k]
+
+            z = bias + response * total
+            output = np.where(z > 0.0, z, 0.0)  # relu
+            sigmoid = activation == 0
+            if sigmoid.any():
+                zs = np.clip(5.0 * z, -60.0, 60.0)
+                output = np.where(sigmoid, 1.0 / (1.0 + np.exp(-zs)), output)
+            tanh = activation == 2
+            if tanh.any():
+                output = np.where(tanh, np.tanh(np.clip(2.5 * z, -60.0, 60.0)), output)
+
+            values[row_index, slot] = output
+
+        return values[:, self.num_inputs:self.num_inputs + self.num_outputs]
@@ -0,0 +1,402 @@
+# benchmark.py - Medidas de desempenho da simulação (headless)
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import neat
+import numpy as np
+
+LOCAL_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(LOCAL_DIR, 'config.txt')
+
+
+def make_genomes(config, size, seed=0):
+    """Cria `size` genomas novos de forma determinística a partir do config"""
+    random.seed(seed)
+    genomes = []
+    for key in range(size):
+        genome = config.genome_type(key)
+        genome.configure_new(config.genome_config)
+        genomes.append((key, genome))
+    return genomes
+
+
+def measure(function, min_time=1.0):
+    """Executa a função repetidamente por pelo menos min_time segundos
+
+    Retorna (repetições, segundos).
+    """
+    repeats = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        function()
+        repeats += 1
+        elapsed = time.perf_counter() - start
+    return repeats, elapsed
+
+
+def bench_simulation(game, config, size, ticks):
+    """Ticks por segundo de eval_genomes para uma população de `size`"""
+    genomes = make_genomes(config, size)
+    game.max_ticks = ticks
+    start = time.perf_counter()
+    game.eval_genomes(genomes, config)
+    elapsed = time.perf_counter() - start
+    game.max_ticks = None
+    return game.points / elapsed
+
+
+def check_fast_forward(game, config, size, ticks, seeds=(0, 1, 2)):
+    """Trilha de referência: fitness com e sem --fast-forward nas mesmas sementes
+
+    Retorna o número de genomas com fitness diferente (deve ser zero: o
+    avanço só pula ticks em que o resultado é comprovadamente o mesmo).
+    """
+    mismatches = 0
+    game.max_ticks = ticks
+    try:
+        for seed in seeds:
+            genomes = make_genomes(config, size, seed)
+            game.seed = seed
+            runs = []
+            for fast_forward in (False, True):
+                game.fast_forward = fast_forward
+                game.eval_genomes(genomes, config)
+                runs.append([genome.fitness for _, genome in genomes])
+            mismatches += sum(a != b for a, b in zip(*runs))
+    finally:
+        game.fast_forward = False
+        game.seed = 0
+        game.max_ticks = None
+    return mismatches
+
+
+def check_collision_tables(settings):
+    """Comparação exaustiva das tabelas de colisão com mask.overlap
+
+    Para cada par de quadros e cada offset (com margem fora da tabela),
+    compara a consulta vetorizada (lookup) e a escalar (collides) com o
+    teste pixel a pixel das máscaras. Retorna o número de diferenças.
+    """
+    atlas = settings.atlas
+    table = settings.collision_table
+    mismatches = 0
+    for (dino_frame, obstacle_frame), (bits, height, width, row0, column0) in table.tables.items():
+        dino_mask, obstacle_mask = atlas.masks[dino_frame], atlas.masks[obstacle_frame]
+        dx = np.arange(-column0 - 2, width - column0 + 2)
+        for dy in range(-row0 - 2, height - row0 + 2):
+            vector = table.lookup(dino_frame, obstacle_frame, dx, np.full(len(dx), dy))
+            for x, hit in zip(dx.tolist(), vector.tolist()):
+                expected = dino_mask.overlap(obstacle_mask, (x, dy)) is not None
+                mismatches += (hit != expected) + (table.collides(dino_frame, obstacle_frame, x, dy) != expected)
+    return mismatches
+
+
+def check_jump_table(settings, buckets=(0, 500, -1), step=3):
+    """Comparação de JumpTable.clears com a simulação do pulo tick a tick
+
+    Para algumas velocidades (índices da tabela) e cada tipo de obstáculo,
+    pula a partir do chão com o obstáculo em várias distâncias e compara
+    a resposta da tabela com DinosaurPopulation e CollisionDetector na
+    mesma velocidade constante. Retorna o número de diferenças.
+    """
+    from population import DinosaurPopulation
+    from obstacles import SmallCactus, LargeCactus, Bird
+
+    atlas = settings.atlas
+    table = settings.jump_table
+    makers = (
+        lambda: SmallCactus(atlas, settings.SMALL_CACTUS_FRAMES, 1),
+        lambda: LargeCactus(atlas, settings.LARGE_CACTUS_FRAMES, 2),
+        lambda: Bird(atlas, settings.BIRD_FRAMES, height_type=1),
+        lambda: Bird(atlas, settings.BIRD_FRAMES, height_type=2),
+    )
+
+    def simulate(speed, make, x):
+        dinosaurs = DinosaurPopulation(1, settings)
+        obstacle = make()
+        obstacle.rect.x = x
+        dinosaurs.jump(np.array([0]))
+        while dinosaurs.jumping[0]:
+            dinosaurs.update()
+            obstacle.update(speed)
+            if len(dinosaurs.check_collision(obstacle)):
+                return False
+        bx, by, bw, bh = atlas.bounds[obstacle.frame]
+        return obstacle.rect.x + bx + bw <= dinosaurs.collision.dino_left
+
+    saved_speed = settings.game_speed
+    mismatches = 0
+    try:
+        for bucket in buckets:
+            speed = settings.game_speed = float(table.speeds[bucket])
+            for make in makers:
+                for x in range(-50, settings.SCREEN_WIDTH + 300, step):
+                    obstacle = make()
+                    obstacle.rect.x = x
+                    mismatches += table.clears(speed, obstacle) != simulate(speed, make, x)
+    finally:
+        settings.game_speed = saved_speed
+    return mismatches
+
+
+class AllocationProbe:
+    """Medidor de memória por tick no lugar do TickProfiler (requer tracemalloc)
+
+    Entre dois ticks soma o pico de memória acima do início do tick
+    (alocações temporárias) e a memória que continuou alocada no fim, e
+    conta as coletas do GC que acontecem dentro do laço (não na montagem
+    da geração).
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.transient = 0
+        self.retained = 0
+        self.collections = 0
+        self.last = 0
+
+    def gc_callback(self, phase, info):
+        if phase == 'stop' and self.ticks:
+            self.collections += 1
+
+    def start(self):
+        tracemalloc.reset_peak()
+        self.last = tracemalloc.get_traced_memory()[0]
+
+    def mark(self, phase):
+        pass
+
+    def tick(self, alive):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.ticks:
+            self.transient += peak - self.last
+            self.retained += current - self.last
+        self.ticks += 1
+        self.last = current
+        tracemalloc.reset_peak()
+
+
+def bench_allocations(game, config, size, ticks):
+    """Memória por tick (temporária e retida) e coletas do GC de eval_genomes
+
+    Retorna (bytes temporários/tick, bytes retidos/tick, coletas por 1000 ticks).
+    """
+    genomes = make_genomes(config, size)
+    probe = AllocationProbe()
+    game.max_ticks = ticks
+    game.profiler = probe
+    gc.callbacks.append(probe.gc_callback)
+    tracemalloc.start()
+    try:
+        game.eval_genomes(genomes, config)
+    finally:
+        tracemalloc.stop()
+        gc.callbacks.remove(probe.gc_callback)
+        game.profiler = None
+        game.max_ticks = None
+    measured = max(probe.ticks - 1, 1)
+    return probe.transient / measured, probe.retained / measured, probe.collections * 1000 / measured
+
+
+def bench_collision_scalar(game, min_time):
+    """Testes de colisão por segundo entre um Dinosaur e obstáculos"""
+    from dinosaur import Dinosaur
+    from obstacles import SmallCactus, LargeCactus, Bird
+
+    settings = game.settings
+    dinosaur = Dinosaur(settings.RUNNING[0], settings)
+    obstacles = [
+        SmallCactus(settings.atlas, settings.SMALL_CACTUS_FRAMES, 0),
+        LargeCactus(settings.atlas, settings.LARGE_CACTUS_FRAMES, 1),
+        Bird(settings.atlas, settings.BIRD_FRAMES, height_type=2),
+    ]
+    # Posições variadas, perto o bastante para que as máscaras se cruzem
+    positions = list(range(20, 180, 4))
+
+    def run():
+        for x in positions:
+            for obstacle in obstacles:
+                obstacle.rect.x = x
+                dinosaur.check_collision(obstacle)
+
+    repeats, elapsed = measure(run, min_time)
+    return repeats * len(positions) * len(obstacles) / elapsed
+
+
+def bench_collision_batch(game, size, min_time):
+    """Testes de colisão por segundo (dinossauro x obstáculo) na população"""
+    from population import DinosaurPopulation
+    from obstacles import LargeCactus
+
+    settings = game.settings
+    dinosaurs = DinosaurPopulation(size, settings)
+    # Estados variados: alturas de pulo e quadros diferentes
+    rng = np.random.default_rng(0)
+    dinosaurs.y[:] = rng.integers(150, 341, size)
+    frames = np.array(settings.dino_frames())
+    dinosaurs.frame[:] = frames[rng.integers(0, len(frames), size)]
+    obstacle = LargeCactus(settings.atlas, settings.LARGE_CACTUS_FRAMES, 2)
+    obstacle.rect.x = 100
+
+    repeats, elapsed = measure(lambda: dinosaurs.check_collision(obstacle), min_time)
+    return repeats * size / elapsed
+
+
+def bench_activation_neat(config, size, min_time):
+    """Ativações por segundo com neat.nn.FeedForwardNetwork (uma por vez)"""
+    nets = [neat.nn.FeedForwardNetwork.create(genome, config) for _, genome in make_genomes(config, size)]
+    inputs = np.random.default_rng(0).random((size, 10)).tolist()
+
+    def run():
+        for net, row in zip(nets, inputs):
+            net.activate(row)
+
+    repeats, elapsed = measure(run, min_time)
+    return repeats * size / elapsed
+
+
+def bench_activation_batch(config, size, min_time):
+    """Ativações por segundo com BatchNetwork (população inteira por chamada)"""
+    from batch_network import BatchNetwork
+
+    network = BatchNetwork.create([genome for _, genome in make_genomes(config, size)], config)
+    inputs = np.random.default_rng(0).random((size, 10))
+
+    repeats, elapsed = measure(lambda: network.activate(inputs), min_time)
+    return repeats * size / elapsed
+
+
+def bench_spawn(game, min_time):
+    """Obstáculos gerados por segundo (sorteio da sequência + criação)"""
+    from obstacle_schedule import ObstacleSchedule
+
+    game.schedule = ObstacleSchedule(game.settings, seed=0)
+    scores = list(range(0, 4000, 50))
+
+    def run():
+        for points in scores:
+            game.clear_obstacles()
+            game.points = points
+            game.generate_obstacles()
+
+    repeats, elapsed = measure(run, min_time)
+    game.clear_obstacles()
+    return repeats * len(scores) / elapsed
+
+
+def bench_startup(repeats=3):
+    """Tempo (s) para criar um Game() em um processo novo (menor de N execuções)"""
+    code = 'from main import Game; Game(headless=True)'
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=LOCAL_DIR, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes=(40, 1000, 10000), ticks=1000, min_time=1.0):
+    """Executa todas as medidas e retorna {nome: {value, unit, higher_is_better}}"""
+    from main import Game, load_config
+
+    os.chdir(LOCAL_DIR)
+    config = load_config(CONFIG_PATH)
+    game = Game(headless=True, seed=0)
+    results = {}
+
+    def record(name, value, unit, higher_is_better=True):
+        results[name] = {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+        print(f"{name:<28} {value:>14,.1f} {unit}")
+
+    for size in sizes:
+        record(f'simulation_ticks_{size}', bench_simulation(game, config, size, ticks), 'ticks/s')
+    transient, retained, collections = bench_allocations(game, config, 1000, ticks)
+    record('allocation_transient_1000', transient, 'bytes/tick', higher_is_better=False)
+    record('allocation_retained_1000', retained, 'bytes/tick', higher_is_better=False)
+    record('gc_collections_1000', collections, 'coletas/1000 ticks', higher_is_better=False)
+    record('collision_scalar', bench_collision_scalar(game, min_time), 'testes/s')
+    record('collision_batch_1000', bench_collision_batch(game, 1000, min_time), 'testes/s')
+    record('activation_neat_1000', bench_activation_neat(config, 1000, min_time), 'ativações/s')
+    record('activation_batch_1000', bench_activation_batch(config, 1000, min_time), 'ativações/s')
+    record('obstacle_spawn', bench_spawn(game, min_time), 'obstáculos/s')
+    record('startup', bench_startup(), 's', higher_is_better=False)
+    record('fast_forward_mismatches', check_fast_forward(game, config, 1000, ticks), 'genomas',
+           higher_is_better=False)
+    record('collision_table_mismatches', check_collision_tables(game.settings), 'offsets',
+           higher_is_better=False)
+    record('jump_table_mismatches', check_jump_table(game.settings), 'pulos', higher_is_better=False)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Lista as medidas que pioraram mais que a tolerância (fração) em relação à base"""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]['value']
+        new = result['value']
+        if result['higher_is_better']:
+            change = (old - new) / old if old else 0.0
+        else:
+            change = (new - old) / old if old else 0.0
+        if change > tolerance:
+            regressions.append((name, old, new, change))
+    return regressions
+
+
+def main(argv=None):
+    """Linha de comando (também usada por `python main.py bench`)"""
+    parser = argparse.ArgumentParser(description='Benchmarks headless do T-Rex Runner NEAT')
+    parser.add_argument('--output', default='benchmark.json', help='arquivo JSON com os resultados')
+    parser.add_argument('--baseline', help='JSON de uma execução anterior para comparação')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='piora máxima aceita, em fração (padrão: 0.10 = 10%%)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[40, 1000, 10000],
+                        help='tamanhos de população da simulação')
+    parser.add_argument('--ticks', type=int, default=1000, help='ticks simulados por tamanho')
+    parser.add_argument('--min-time', type=float, default=1.0, help='duração mínima de cada medida (s)')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.ticks, args.min_time)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Resultados salvos em {args.output}")
+
+    # Correção, não desempenho: qualquer diferença falha, com ou sem base
+    if results['fast_forward_mismatches']['value']:
+        print("ERRO: --fast-forward mudou o fitness da trilha de referência")
+        return 1
+    if results['collision_table_mismatches']['value']:
+        print("ERRO: as tabelas de colisão diferem de mask.overlap")
+        return 1
+    if results['jump_table_mismatches']['value']:
+        print("ERRO: JumpTable.clears difere da simulação do pulo")
+        return 1
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, old, new, change in regressions:
+            print(f"REGRESSÃO {name}: {old:,.1f} -> {new:,.1f} ({change:.0%} pior)")
+        if regressions:
+            return 1
+        print(f"Nenhuma regressão acima de {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
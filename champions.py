@@ -0,0 +1,172 @@
+import hashlib
+import html
+import multiprocessing
+import os
+import threading
+import neat
+
+# Configuração do NEAT de cada processo do pool (carregada uma vez por processo)
+_worker_config = None
+
+
+def _init_worker(config_path):
+    """Carrega a configuração e prepara o matplotlib sem janela no processo do pool"""
+    global _worker_config
+    import matplotlib
+    matplotlib.use('Agg')
+    from main import load_config
+
+    _worker_config = load_config(config_path)
+
+
+def _render(diagram, filename):
+    """Desenha em filename.svg o diagrama de compact_diagram (executado no pool)"""
+    from visualization import draw_neural_network
+
+    # Genoma mínimo com o que draw_neural_network lê: nós e conexões
+    nodes, links = diagram
+    genome = neat.DefaultGenome(0)
+    for key in nodes:
+        genome.nodes[key] = neat.genome.DefaultNodeGene(key)
+    for i, o, weight in links:
+        cg = genome.connections[(i, o)] = neat.genome.DefaultConnectionGene((i, o))
+        cg.weight = weight
+        cg.enabled = True
+
+    try:
+        draw_neural_network(_worker_config, genome, filename=filename)
+    except Exception as error:
+        # As exceções do graphviz não voltam intactas pelo pickle do pool
+        raise RuntimeError(str(error)) from None
+    finally:
+        # O código-fonte do graphviz não é necessário (com ou sem SVG)
+        if os.path.exists(filename):
+            os.remove(filename)
+    return filename + '.svg'
+
+
+def compact_diagram(genome):
+    """Tudo o que draw_neural_network desenha: nós e conexões habilitadas com peso
+
+    Tuplas simples, baratas de serializar para o pool (o genoma inteiro não vai).
+    """
+    nodes = tuple(sorted(genome.nodes))
+    links = tuple((i, o, cg.weight) for (i, o), cg in sorted(genome.connections.items()) if cg.enabled)
+    return nodes, links
+
+
+def diagram_key(diagram):
+    """Hash do conteúdo de um diagrama de compact_diagram"""
+    nodes, links = diagram
+    text = ','.join(map(str, nodes)) + '|' + ','.join(f'{i}:{o}:{w.hex()}' for i, o, w in links)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ChampionRenderer(neat.reporting.BaseReporter):
+    """Desenha o campeão de cada espécie a cada `interval` gerações, em um pool
+
+    No fim da geração só se escolhe o campeão (maior fitness) de cada
+    espécie e se calcula o hash do diagrama; o desenho com graphviz fica
+    com os processos do pool. Diagramas iguais (mesmos nós, conexões e
+    pesos) são desenhados uma vez: o arquivo tem o nome do hash e as
+    gerações seguintes só apontam para ele. Um desenho que falha é
+    tentado de novo quando o diagrama reaparece. O índice `index.html`
+    liga geração -> espécie -> diagrama e só aponta para SVGs prontos.
+    """
+
+    def __init__(self, config_path, interval=10, directory='champions', processes=None):
+        self.interval = interval
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        # Processos novos (spawn): nada do pygame ou do estado do treino é herdado
+        context = multiprocessing.get_context('spawn')
+        self.pool = context.Pool(processes, initializer=_init_worker, initargs=(config_path,))
+
+        # Hash do diagrama -> nome do SVG já desenhado
+        self.diagrams = {}
+        # Hashes com desenho em andamento no pool
+        self.pending = set()
+        # Geração -> [(espécie, genome_id, fitness, hash do diagrama)]
+        self.index = {}
+        self.generation = None
+        self.failed = False
+        # Os callbacks do pool rodam em outra thread
+        self.lock = threading.Lock()
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        if self.generation % self.interval != 0:
+            return
+
+        entries = []
+        for sid, s in sorted(species.species.items()):
+            members = [g for g in s.members.values() if g.fitness is not None]
+            if not members:
+                continue
+            champion = max(members, key=lambda g: g.fitness)
+
+            diagram = compact_diagram(champion)
+            key = diagram_key(diagram)
+            with self.lock:
+                render = key not in self.diagrams and key not in self.pending
+                if render:
+                    self.pending.add(key)
+            if render:
+                name = os.path.join(self.directory, f'net-{key[:16]}')
+                self.pool.apply_async(_render, (diagram, name),
+                                      callback=lambda svg, key=key: self._rendered(key, svg),
+                                      error_callback=lambda error, key=key: self._render_failed(key, error))
+            entries.append((sid, champion.key, champion.fitness, key))
+
+        with self.lock:
+            self.index[self.generation] = entries
+            self.write_index()
+
+    def _rendered(self, key, svg):
+        with self.lock:
+            self.pending.discard(key)
+            self.diagrams[key] = os.path.basename(svg)
+            self.write_index()
+
+    def _render_failed(self, key, error):
+        with self.lock:
+            # Fora de pending e de diagrams: desenhado de novo se reaparecer
+            self.pending.discard(key)
+            self.write_index()
+        if not self.failed:
+            # Sem o executável do graphviz nenhum diagrama sai; avisar uma vez
+            print(f"Campeões: diagrama não desenhado ({error})")
+            self.failed = True
+
+    def write_index(self):
+        """Grava index.html: geração -> espécie -> diagrama (chamar com o lock)"""
+        lines = ['<!DOCTYPE html>', '<html><head><meta charset="utf-8">',
+                 '<title>Campeões das espécies</title></head><body>', '<h1>Campeões das espécies</h1>']
+        for generation in sorted(self.index, reverse=True):
+            lines.append(f'<h2>Geração {generation}</h2><ul>')
+            for sid, genome_id, fitness, key in self.index[generation]:
+                svg = self.diagrams.get(key)
+                if svg is not None:
+                    label = f'<a href="{html.escape(svg)}">Espécie {sid}</a>'
+                elif key in self.pending:
+                    label = f'Espécie {sid} (desenhando)'
+                else:
+                    label = f'Espécie {sid} (diagrama não desenhado)'
+                lines.append(f'<li>{label}: genoma {genome_id}, fitness {fitness:.2f}</li>')
+            lines.append('</ul>')
+        lines.append('</body></html>')
+
+        path = os.path.join(self.directory, 'index.html')
+        with open(path + '.tmp', 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(path + '.tmp', path)
+
+    def close(self):
+        """Espera os desenhos pendentes e encerra o pool"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
@@ -0,0 +1,176 @@
+import atexit
+import glob
+import itertools
+import lzma
+import os
+import pickle
+import queue
+import random
+import re
+import threading
+import neat
+
+# Cabeçalho do formato: identificação + versão (um byte) + pickle comprimido com LZMA
+MAGIC = b'DINOPY-CKPT'
+VERSION = 1
+
+
+class AsyncWriter:
+    """Grava arquivos em uma thread separada
+
+    O laço de treino só entrega os bytes já serializados; compressão e
+    escrita acontecem na thread, então o jogo nunca espera pelo disco. Cada
+    arquivo é escrito em um temporário e renomeado, assim uma queda no meio
+    da escrita nunca deixa um arquivo pela metade.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.thread = None
+
+    def write(self, path, data, compress=False, message=None):
+        """Agenda a escrita de `data` em `path` (com cabeçalho e LZMA se compress)"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            atexit.register(self.close)
+        self.queue.put((path, data, compress, message))
+
+    def remove(self, path):
+        """Agenda a remoção de um arquivo (depois das escritas já agendadas)"""
+        self.write(path, None)
+
+    def _run(self):
+        while True:
+            task = self.queue.get()
+            if task is None:
+                break
+            path, data, compress, message = task
+            if data is None:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if compress:
+                data = MAGIC + bytes([VERSION]) + lzma.compress(data)
+            try:
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(data)
+                os.replace(path + '.tmp', path)
+                if message:
+                    print(message)
+            except OSError as error:
+                print(f"Erro ao salvar {path}: {error}")
+
+    def close(self):
+        """Espera as escritas pendentes terminarem"""
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+
+def load(path):
+    """Lê um checkpoint gravado por Checkpointer"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} não é um checkpoint do DinoPy")
+    version = data[len(MAGIC)]
+    if version != VERSION:
+        raise ValueError(f"Versão de checkpoint não suportada: {version}")
+    return pickle.loads(lzma.decompress(data[len(MAGIC) + 1:]))
+
+
+def restore(path, config):
+    """Recria a neat.Population de um checkpoint
+
+    Restaura também o estado do gerador aleatório e os contadores de IDs de
+    genomas e espécies, para que os novos IDs não repitam os antigos.
+    """
+    state = load(path)
+
+    reporters = neat.reporting.ReporterSet()
+    species_set = config.species_set_type(config.species_set_config, reporters)
+    species_set.species = state['species']
+    species_set.genome_to_species = state['genome_to_species']
+    species_set.indexer = itertools.count(max(state['species'], default=0) + 1)
+
+    population = neat.Population(config, (state['population'], species_set, state['generation']))
+    # Population cria seu próprio ReporterSet; as espécies devem usar o mesmo
+    species_set.reporters = population.reporters
+    population.best_genome = state['best_genome']
+    population.reproduction.genome_indexer = itertools.count(max(state['population']) + 1)
+    # Próxima chave de nó oculto (None: o NEAT a calcula no primeiro nó novo)
+    next_node_key = state.get('next_node_key')
+    config.genome_config.node_indexer = None if next_node_key is None else itertools.count(next_node_key)
+
+    random.setstate(state['random'])
+
+    print(f"Treino retomado de {path} (geração {state['generation']})")
+    return population
+
+
+class Checkpointer(neat.reporting.BaseReporter):
+    """Salva periodicamente o estado do treino sem pausar o jogo
+
+    A cada `interval` gerações guarda população, espécies, melhor genoma
+    e estado do gerador aleatório (as estatísticas ficam em stats.jsonl).
+    O estado é serializado no fim da geração (antes que o NEAT o altere) e
+    comprimido e gravado pela AsyncWriter. Só os `keep` checkpoints mais recentes são mantidos.
+    """
+
+    def __init__(self, interval=5, prefix='checkpoint', keep=3, writer=None):
+        self.interval = interval
+        self.prefix = prefix
+        self.keep = keep
+        self.writer = writer or AsyncWriter()
+        self.best_genome = None
+        self.generation = None
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        # Melhor genoma de todas as gerações (o mesmo que Population guarda)
+        if self.best_genome is None or best_genome.fitness > self.best_genome.fitness:
+            self.best_genome = best_genome
+
+    def end_generation(self, config, population, species_set):
+        # A próxima geração a rodar é a seguinte à atual
+        generation = self.generation + 1
+        if generation % self.interval != 0:
+            return
+
+        # Próxima chave de nó do NEAT (o contador é consumido e recriado)
+        next_node_key = None
+        if config.genome_config.node_indexer is not None:
+            next_node_key = next(config.genome_config.node_indexer)
+            config.genome_config.node_indexer = itertools.count(next_node_key)
+
+        state = {
+            'generation': generation,
+            'next_node_key': next_node_key,
+            'population': population,
+            'species': species_set.species,
+            'genome_to_species': species_set.genome_to_species,
+            'best_genome': self.best_genome,
+            'random': random.getstate(),
+        }
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+        path = f'{self.prefix}-{generation}.ckpt'
+        self.writer.write(path, data, compress=True, message=f"Checkpoint salvo em {path}")
+
+        # Remover os checkpoints mais antigos, mantendo `keep` com o novo
+        # (arquivos fora do padrão prefixo-N.ckpt, como cópias, são ignorados)
+        pattern = re.compile(re.escape(self.prefix) + r'-(\d+)\.ckpt$')
+        numbered = []
+        for p in glob.glob(f'{glob.escape(self.prefix)}-*.ckpt'):
+            match = pattern.match(p)
+            if match and p != path:
+                numbered.append((int(match.group(1)), p))
+        paths = [p for _, p in sorted(numbered)]
+        for old in paths[:max(0, len(paths) - (self.keep - 1))] if self.keep else []:
+            self.writer.remove(old)
@@ -0,0 +1,195 @@
+import glob
+import hashlib
+import os
+import zipfile
+import numpy as np
+
+
+class CollisionTable:
+    """Tabelas pré-calculadas de sobreposição pixel a pixel
+
+    Os quadros do dinossauro e dos obstáculos são fixos, então a colisão é
+    uma função pura de (quadro do dinossauro, quadro do obstáculo, dx, dy),
+    com (dx, dy) = posição do obstáculo - posição do dinossauro, o mesmo
+    offset de pygame.mask.Mask.overlap. Para cada par de quadros a tabela
+    guarda um bit por offset em que as caixas se cruzam (fora delas não há
+    colisão), compactado com np.packbits.
+
+    As tabelas ficam em cache no disco, junto dos assets, e são
+    reconstruídas quando algum PNG muda.
+    """
+
+    VERSION = 1
+
+    def __init__(self, tables):
+        # (quadro do dinossauro, quadro do obstáculo) -> (bits, altura, largura, linha0, coluna0)
+        self.tables = tables
+        # Mesmas tabelas em bytes, para consultas escalares sem NumPy:
+        # par -> (bits, bytes por linha, altura, largura, linha0, coluna0)
+        self.rows = {
+            pair: (bits.tobytes(), bits.shape[1], height, width, row0, column0)
+            for pair, (bits, height, width, row0, column0) in tables.items()
+        }
+
+    @staticmethod
+    def _mask_array(mask):
+        """Converte uma máscara do pygame em um array booleano (altura, largura)"""
+        width, height = mask.get_size()
+        return np.array([[mask.get_at((x, y)) for x in range(width)] for y in range(height)], dtype=bool)
+
+    @staticmethod
+    def _overlap_table(dino, obstacle):
+        """Sobreposição para todos os offsets: convolução da máscara do
+        dinossauro com a do obstáculo invertida (via FFT)"""
+        height = dino.shape[0] + obstacle.shape[0] - 1
+        width = dino.shape[1] + obstacle.shape[1] - 1
+        counts = np.fft.irfft2(
+            np.fft.rfft2(dino, (height, width)) * np.fft.rfft2(obstacle[::-1, ::-1], (height, width)),
+            (height, width)
+        )
+        # As contagens são inteiras; 0.5 separa com folga o erro da FFT
+        return counts > 0.5
+
+    @classmethod
+    def build(cls, atlas, dino_frames, obstacle_frames):
+        """Calcula as tabelas de todos os pares de quadros"""
+        arrays = {frame: cls._mask_array(atlas.masks[frame])
+                  for frame in tuple(dino_frames) + tuple(obstacle_frames)}
+        tables = {}
+        for dino_frame in dino_frames:
+            for obstacle_frame in obstacle_frames:
+                obstacle = arrays[obstacle_frame]
+                table = cls._overlap_table(arrays[dino_frame], obstacle)
+                height, width = table.shape
+                # Linha = dy + linha0, coluna = dx + coluna0
+                tables[(dino_frame, obstacle_frame)] = (
+                    np.packbits(table, axis=1), height, width,
+                    obstacle.shape[0] - 1, obstacle.shape[1] - 1
+                )
+        return cls(tables)
+
+    @staticmethod
+    def source_key(dino_frames, obstacle_frames, assets_dir='Assets'):
+        """Identificador do conteúdo dos PNGs e dos quadros usados"""
+        digest = hashlib.sha256(f'{CollisionTable.VERSION} {dino_frames} {obstacle_frames}'.encode())
+        for path in sorted(glob.glob(os.path.join(assets_dir, '**', '*.png'), recursive=True)):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def save(self, path, key):
+        """Grava as tabelas compactadas em um arquivo .npz"""
+        pairs = sorted(self.tables)
+        data = {'key': np.array(key), 'pairs': np.array(pairs, dtype=np.int64)}
+        for n, pair in enumerate(pairs):
+            bits, height, width, row0, column0 = self.tables[pair]
+            data[f'bits_{n}'] = bits
+            data[f'shape_{n}'] = np.array([height, width, row0, column0], dtype=np.int64)
+        # Temporário (um por processo) + renomeação: uma escrita interrompida,
+        # ou vários processos iniciando juntos, nunca deixa um cache pela metade
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temporary, 'wb') as f:
+                np.savez_compressed(f, **data)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    @classmethod
+    def load(cls, atlas, dino_frames, obstacle_frames, path='Assets/collision_tables.npz'):
+        """Lê as tabelas do cache, reconstruindo-as se os PNGs mudaram"""
+        key = cls.source_key(dino_frames, obstacle_frames, os.path.dirname(path) or '.')
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    if str(data['key']) == key:
+                        tables = {}
+                        for n, pair in enumerate(data['pairs'].tolist()):
+                            height, width, row0, column0 = data[f'shape_{n}'].tolist()
+                            tables[tuple(pair)] = (data[f'bits_{n}'], height, width, row0, column0)
+                        return cls(tables)
+            except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+                pass  # Cache corrompido ou de outra versão: reconstruir
+
+        table = cls.build(atlas, dino_frames, obstacle_frames)
+        try:
+            table.save(path, key)
+        except OSError:
+            pass  # Sem permissão de escrita: usar só em memória
+        return table
+
+    def lookup(self, dino_frame, obstacle_frame, dx, dy):
+        """Há colisão com o obstáculo deslocado (dx, dy)? Aceita escalares ou arrays"""
+        bits, height, width, row0, column0 = self.tables[(dino_frame, obstacle_frame)]
+        row = np.asarray(dy) + row0
+        column = np.asarray(dx) + column0
+        inside = (row >= 0) & (row < height) & (column >= 0) & (column < width)
+        row = np.where(inside, row, 0)
+        column = np.where(inside, column, 0)
+        bit = (bits[row, column >> 3] >> (7 - (column & 7))) & 1
+        return inside & (bit == 1)
+
+    def collides(self, dino_frame, obstacle_frame, dx, dy):
+        """lookup para um único offset inteiro, só com operações de Python"""
+        bits, row_bytes, height, width, row0, column0 = self.rows[(dino_frame, obstacle_frame)]
+        row = dy + row0
+        column = dx + column0
+        if row < 0 or row >= height or column < 0 or column >= width:
+            return False
+        return bool((bits[row * row_bytes + (column >> 3)] >> (7 - (column & 7))) & 1)
+
+
+class CollisionDetector:
+    """Colisão entre um obstáculo e uma população de dinossauros
+
+    1. Rejeição em x: todos os dinossauros estão em X_POS, então se a faixa
+       horizontal opaca de qualquer quadro do dinossauro não cruza a do
+       obstáculo, ninguém colide.
+    2. Para cada quadro do dinossauro presente, uma consulta vetorizada à
+       CollisionTable decide a colisão de todos os dinossauros nesse quadro.
+
+    O resultado é o mesmo de testar a máscara de cada dinossauro.
+    """
+
+    def __init__(self, atlas, table, dino_frames, x_pos):
+        self.atlas = atlas
+        self.table = table
+        self.dino_frames = tuple(dino_frames)
+        self.x_pos = x_pos
+
+        # Faixa x dos pixels opacos de qualquer quadro do dinossauro
+        bounds = [atlas.bounds[frame] for frame in self.dino_frames]
+        self.dino_left = x_pos + min(x for x, y, w, h in bounds)
+        self.dino_right = x_pos + max(x + w for x, y, w, h in bounds)
+
+    def reaches(self, obstacle):
+        """A faixa x do obstáculo alcança algum dinossauro?"""
+        x, y, w, h = self.atlas.bounds[obstacle.frame]
+        left = obstacle.rect.x + x
+        return left < self.dino_right and left + w > self.dino_left
+
+    def check(self, obstacle, frame, y, candidates):
+        """Índices (de candidates) dos dinossauros que colidem com o obstáculo"""
+        if len(candidates) == 0 or not self.reaches(obstacle):
+            return candidates[:0]
+
+        frames = frame[candidates]
+        dy = obstacle.rect.y - y[candidates]
+        dx = obstacle.rect.x - self.x_pos
+
+        hits = np.zeros(len(candidates), dtype=bool)
+        for dino_frame in self.dino_frames:
+            selected = frames == dino_frame
+            if selected.any():
+                hits[selected] = self.table.lookup(dino_frame, obstacle.frame, dx, dy[selected])
+        return candidates[hits]
+
+
+if __name__ == '__main__':
+    # Pré-calcular o cache das tabelas (por exemplo, ao instalar em um servidor)
+    from game_settings import Settings
+
+    settings = Settings()
+    settings.load_images()
+    print(f"Tabelas de colisão: {len(settings.collision_table.tables)} pares de quadros")
@@ -0,0 +1,178 @@
+import math
+import os
+import struct
+import sys
+from array import array
+
+# Cabeçalho do formato: identificação + versão (um byte) + contagens e fitness
+MAGIC = b'DINOPY-NET'
+VERSION = 1
+HEADER = struct.Struct('<IIIId')  # entradas, saídas, nós, conexões, fitness
+
+# Mesma ordem de códigos de batch_network.ACTIVATIONS (activation_options do config.txt)
+ACTIVATIONS = ('sigmoid', 'relu', 'tanh')
+
+
+def _sigmoid(z):
+    z = max(-60.0, min(60.0, 5.0 * z))
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def _relu(z):
+    return z if z > 0.0 else 0.0
+
+
+def _tanh(z):
+    z = max(-60.0, min(60.0, 2.5 * z))
+    return math.tanh(z)
+
+
+# Mesmas fórmulas de neat.activations, na ordem de ACTIVATIONS
+FUNCTIONS = (_sigmoid, _relu, _tanh)
+
+
+class CompiledNetwork:
+    """Rede efetiva de um genoma, avaliada sem o neat
+
+    Só os nós necessários para as saídas, em ordem topológica, cada um com
+    suas conexões habilitadas na ordem do genoma. activate faz as mesmas
+    contas de neat.nn.FeedForwardNetwork, na mesma ordem, então as saídas
+    são idênticas.
+
+    Posições da lista de valores:
+        0 .. num_inputs-1         entradas
+        num_inputs .. + nós - 1   nós avaliados (na ordem)
+        última                    zero (saídas sem conexões)
+    """
+
+    def __init__(self, num_inputs, output_slots, activation, bias, response, link_start,
+                 link_source, link_weight, fitness=0.0):
+        self.num_inputs = num_inputs
+        self.output_slots = list(output_slots)
+        self.fitness = fitness
+
+        # Arrays do arquivo (guardados para save)
+        self.activation = array('B', activation)
+        self.bias = array('d', bias)
+        self.response = array('d', response)
+        self.link_start = array('I', link_start)
+        self.link_source = array('I', link_source)
+        self.link_weight = array('d', link_weight)
+
+        # (posição, função, bias, response, [(origem, peso)]) por nó
+        self.nodes = []
+        for i in range(len(self.bias)):
+            start, stop = self.link_start[i], self.link_start[i + 1]
+            links = list(zip(self.link_source[start:stop], self.link_weight[start:stop]))
+            self.nodes.append((num_inputs + i, FUNCTIONS[self.activation[i]], self.bias[i], self.response[i], links))
+        self.size = num_inputs + len(self.nodes) + 1
+
+    @staticmethod
+    def from_genome(genome, config):
+        """Poda o genoma para a rede efetiva (mesma lógica de FeedForwardNetwork.create)"""
+        from neat.graphs import feed_forward_layers
+
+        genome_config = config.genome_config
+        input_keys = genome_config.input_keys
+        output_keys = genome_config.output_keys
+
+        connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+        slots = {key: i for i, key in enumerate(input_keys)}
+
+        activation, bias, response = [], [], []
+        link_start, link_source, link_weight = [0], [], []
+        for layer in feed_forward_layers(input_keys, output_keys, connections):
+            for node in layer:
+                ng = genome.nodes[node]
+                if ng.aggregation != 'sum':
+                    raise ValueError(f"Agregação não suportada: {ng.aggregation}")
+                for inode, onode in connections:
+                    if onode == node:
+                        link_source.append(slots[inode])
+                        link_weight.append(genome.connections[(inode, onode)].weight)
+                link_start.append(len(link_source))
+                slots[node] = len(input_keys) + len(bias)
+                activation.append(ACTIVATIONS.index(ng.activation))
+                bias.append(ng.bias)
+                response.append(ng.response)
+
+        # Saídas que nenhum caminho alcança valem zero, como no neat
+        zero = len(input_keys) + len(bias)
+        output_slots = [slots.get(key, zero) for key in output_keys]
+        return CompiledNetwork(len(input_keys), output_slots, activation, bias, response,
+                               link_start, link_source, link_weight, genome.fitness or 0.0)
+
+    def activate(self, inputs):
+        """Avalia a rede: lista de entradas -> lista de saídas"""
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError(f"Esperadas {self.num_inputs} entradas, recebidas {len(inputs)}")
+        values = list(inputs)
+        values.extend([0.0] * (self.size - len(values)))
+        for slot, function, bias, response, links in self.nodes:
+            total = sum([values[source] * weight for source, weight in links])
+            values[slot] = function(bias + response * total)
+        return [values[slot] for slot in self.output_slots]
+
+    def save(self, path):
+        """Grava a rede no formato binário (sem pickle, little-endian)"""
+        data = bytearray(MAGIC + bytes([VERSION]))
+        data += HEADER.pack(self.num_inputs, len(self.output_slots), len(self.nodes),
+                            len(self.link_source), self.fitness)
+        for values in (array('I', self.output_slots), self.activation, self.bias, self.response,
+                       self.link_start, self.link_source, self.link_weight):
+            data += _little_endian(values).tobytes()
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+
+    @staticmethod
+    def load(path):
+        """Lê uma rede gravada por save (só números: nenhum código é executado)"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} não é uma rede compilada do DinoPy")
+        version = data[len(MAGIC)]
+        if version != VERSION:
+            raise ValueError(f"Versão de rede compilada não suportada: {version}")
+
+        offset = len(MAGIC) + 1
+        num_inputs, num_outputs, num_nodes, num_links, fitness = HEADER.unpack_from(data, offset)
+        offset += HEADER.size
+
+        def read(typecode, count):
+            nonlocal offset
+            values = array(typecode)
+            size = values.itemsize * count
+            if offset + size > len(data):
+                raise ValueError(f"{path} está truncado")
+            values.frombytes(data[offset:offset + size])
+            offset += size
+            return _little_endian(values)
+
+        output_slots = read('I', num_outputs)
+        activation = read('B', num_nodes)
+        bias = read('d', num_nodes)
+        response = read('d', num_nodes)
+        link_start = read('I', num_nodes + 1)
+        link_source = read('I', num_links)
+        link_weight = read('d', num_links)
+        # Índices fora da rede tornariam o arquivo inválido
+        if max(activation, default=0) >= len(FUNCTIONS):
+            raise ValueError(f"{path} tem uma ativação desconhecida")
+        for i in range(num_nodes):
+            start, stop = link_start[i], link_start[i + 1]
+            if not start <= stop <= num_links or max(link_source[start:stop], default=0) >= num_inputs + i:
+                raise ValueError(f"{path} tem conexões inválidas")
+        if max(output_slots, default=0) > num_inputs + num_nodes:
+            raise ValueError(f"{path} tem saídas inválidas")
+        return CompiledNetwork(num_inputs, output_slots, activation, bias, response,
+                               link_start, link_source, link_weight, fitness)
+
+
+def _little_endian(values):
+    """Cópia em little-endian (o formato do arquivo) se a máquina for big-endian"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+import queue
+import neat
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta http-equiv="refresh" content="{refresh}">
+<title>T-Rex Runner NEAT - geração {generation}</title>
+</head>
+<body>
+<h1>Geração {generation}</h1>
+<p>Melhor fitness: {fitness:.2f}</p>
+<img src="fitness.svg" width="48%">
+<img src="species.svg" width="48%">
+<img src="network.svg">
+</body>
+</html>
+"""
+
+
+def _run_dashboard(frames, config_path, stats_path, directory, refresh):
+    """Processo do painel: desenha cada quadro recebido até receber None"""
+    # Sem janela: os gráficos vão para arquivos (importação só neste processo)
+    import matplotlib
+    matplotlib.use('Agg')
+    from main import load_config
+    from stats_log import StatsLogReader
+    from visualization import plot_stats, plot_species, draw_neural_network
+
+    config = load_config(config_path)
+    os.makedirs(directory, exist_ok=True)
+    reader = StatsLogReader(stats_path)
+    network_failed = False
+
+    while True:
+        frame = frames.get()
+        stop = frame is None
+        # Atrasado? Descartar os quadros antigos e desenhar só o mais recente
+        try:
+            while not stop:
+                newer = frames.get_nowait()
+                if newer is None:
+                    stop = True
+                else:
+                    frame = newer
+        except queue.Empty:
+            pass
+
+        if frame is not None:
+            generation, genome = frame
+            plot_stats(reader, filename=os.path.join(directory, 'fitness.svg'))
+            plot_species(reader, filename=os.path.join(directory, 'species.svg'))
+            if not network_failed:
+                try:
+                    draw_neural_network(config, genome, filename=os.path.join(directory, 'network'))
+                except Exception as error:
+                    # Sem o executável do graphviz os gráficos continuam sem a rede
+                    print(f"Painel: rede não desenhada ({error})")
+                    network_failed = True
+
+            page = PAGE.format(refresh=refresh, generation=generation, fitness=genome.fitness)
+            path = os.path.join(directory, 'index.html')
+            with open(path + '.tmp', 'w') as f:
+                f.write(page)
+            os.replace(path + '.tmp', path)
+
+        if stop:
+            break
+
+
+class Dashboard(neat.reporting.BaseReporter):
+    """Painel do treino atualizado a cada geração, desenhado em outro processo
+
+    Ao fim de cada geração o reporter só entrega (geração, melhor genoma)
+    a uma fila de um lugar, sem esperar: se o painel ainda está desenhando,
+    o quadro pendente é substituído pelo novo. O processo do painel lê as
+    curvas de stats.jsonl (incrementalmente) e usa plot_stats,
+    plot_species e draw_neural_network para gravar SVGs e uma página
+    index.html que se recarrega sozinha no diretório `directory`.
+
+    Deve ser adicionado depois do StatsLog, para que a linha da geração já
+    esteja no log quando o quadro chega.
+    """
+
+    def __init__(self, config_path, stats_path='stats.jsonl', directory='dashboard', refresh=5):
+        # Processo novo (spawn): nada do pygame ou do estado do treino é herdado
+        context = multiprocessing.get_context('spawn')
+        self.frames = context.Queue(maxsize=1)
+        self.process = context.Process(
+            target=_run_dashboard,
+            args=(self.frames, config_path, stats_path, directory, refresh),
+            daemon=True
+        )
+        self.process.start()
+        self.generation = None
+        print(f"Painel do treino em {os.path.join(directory, 'index.html')}")
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        self.send((self.generation, best_genome))
+
+    def send(self, frame):
+        """Entrega um quadro sem bloquear, descartando o pendente se houver"""
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.frames.put_nowait(frame)
+            except queue.Full:
+                pass  # O painel fica com o quadro que já estava lá
+
+    def close(self, timeout=30):
+        """Desenha o último quadro pendente e encerra o processo do painel"""
+        if self.process is None:
+            return
+        try:
+            self.frames.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
@@ -4,6 +4,12 @@ import random
 
 
 class Dinosaur:
+    __slots__ = (
+        'settings', 'X_POS', 'NORMAL_Y', 'DUCK_Y', 'JUMP_VEL',
+        'frame', 'running', 'jumping', 'ducking', 'jump_vel', 'step_index',
+        'rect', 'color',
+    )
+
     def __init__(self, image, settings):
         # Configurações
         self.settings = settings
@@ -12,8 +18,8 @@ class Dinosaur:
         self.DUCK_Y = 340  # Posição Y agachado
         self.JUMP_VEL = 8.5  # Velocidade inicial do pulo
 
-        # Estado do dinossauro
-        self.image = image
+        # Estado do dinossauro (frame é o índice do quadro no atlas)
+        self.frame = settings.RUNNING_FRAMES[0]
         self.running = True
         self.jumping = False
         self.ducking = False
@@ -30,9 +36,10 @@ class Dinosaur:
             random.randint(0, 255)
         )
 
-        # Otimizar a máscara de colisão
-        self._mask = None
-        self._last_image = None
+    @property
+    def image(self):
+        """Quadro atual do dinossauro"""
+        return self.settings.atlas.surfaces[self.frame]
 
     def update(self):
         """Atualiza o estado do dinossauro"""
@@ -56,23 +63,19 @@ class Dinosaur:
             self.ducking = False
 
         # Ajusta o sprite para pulo
-        self.image = self.settings.JUMPING
+        self.frame = self.settings.JUMPING_FRAME
 
         #RELER LINHAS ABAIXO PARA TENTAR ARRUMAR O PULO NAS ALTURAS
 
-        # Sistema de pulo melhorado com física mais realista
-        # Calcular fator de velocidade com base logarítmica para evitar crescimento excessivo
-        base_speed = self.settings.INITIAL_GAME_SPEED
-        speed_ratio = self.settings.game_speed / base_speed
-        speed_factor = 1 + (speed_ratio - 1) * 0.3  # Crescimento mais controlado
+        # Sistema de pulo melhorado com física mais realista: multiplicador do
+        # pulo e gravidade crescem de forma controlada com a velocidade
+        # (fórmulas em JumpTable.factors, calculadas uma vez por velocidade)
+        jump_multiplier, gravity_adjustment = self.settings.jump_table.factors(self.settings.game_speed)
 
         # Movimento vertical ajustado dinamicamente
-        jump_multiplier = 4 * min(speed_factor, 2)  # Limitar o multiplicador máximo Original é 2.5
         self.rect.y -= self.jump_vel * jump_multiplier
 
         # Gravidade ajustada dinamicamente com balanceamento
-        base_gravity = 0.8
-        gravity_adjustment = base_gravity * (1 + (speed_factor - 1) * 0.4)  # Crescimento proporcional mas controlado
         self.jump_vel -= gravity_adjustment
 
         # Verificar se o pulo acabou
@@ -84,9 +87,6 @@ class Dinosaur:
                 self.running = True
                 self.jump_vel = self.JUMP_VEL
 
-        # Invalidar a máscara atual quando muda de imagem
-        self._mask = None
-
     def duck(self):
         """Faz o dinossauro se agachar"""
         self.ducking = True
@@ -94,20 +94,11 @@ class Dinosaur:
         self.jumping = False
 
         # Alterna entre sprites de agachamento
-        self.image = self.settings.DUCKING[(self.step_index // 5) % len(self.settings.DUCKING)]
-        self.rect.y = self.DUCK_Y
+        self.frame = self.settings.DUCKING_FRAMES[(self.step_index // 5) % len(self.settings.DUCKING_FRAMES)]
         self.step_index += 1
 
-        # Ajusta o retângulo para a colisão correta
-        self.rect = pygame.Rect(
-            self.X_POS,
-            self.DUCK_Y,
-            self.image.get_width(),
-            self.image.get_height()
-        )
-
-        # Invalidar a máscara atual quando muda de imagem
-        self._mask = None
+        # Ajusta o retângulo (no próprio objeto) para a colisão correta
+        self.rect.update((self.X_POS, self.DUCK_Y), self.settings.atlas.sizes[self.frame])
 
     def stop_duck(self):
         """Para de agachar"""
@@ -115,33 +106,16 @@ class Dinosaur:
         self.running = True
 
         # Ajustar retângulo para posição normal
-        self.rect.y = self.NORMAL_Y
-        self.rect = pygame.Rect(
-            self.X_POS,
-            self.NORMAL_Y,
-            self.settings.RUNNING[0].get_width(),
-            self.settings.RUNNING[0].get_height()
-        )
+        self.rect.update((self.X_POS, self.NORMAL_Y), self.settings.atlas.sizes[self.settings.RUNNING_FRAMES[0]])
 
     def run(self):
         """Animação de corrida do dinossauro"""
-        self.image = self.settings.RUNNING[self.step_index // 5]
+        self.frame = self.settings.RUNNING_FRAMES[self.step_index // 5]
 
-        # Garantir posição correta
-        self.rect.x = self.X_POS
-        self.rect.y = self.NORMAL_Y
         self.step_index += 1
 
-        # Redefinir retângulo para garantir dimensões corretas
-        self.rect = pygame.Rect(
-            self.X_POS,
-            self.NORMAL_Y,
-            self.image.get_width(),
-            self.image.get_height()
-        )
-
-        # Invalidar a máscara atual quando muda de imagem
-        self._mask = None
+        # Garantir posição e dimensões corretas (no próprio retângulo)
+        self.rect.update((self.X_POS, self.NORMAL_Y), self.settings.atlas.sizes[self.frame])
 
     def draw(self, screen):
         """Desenha o dinossauro na tela"""
@@ -164,23 +138,13 @@ class Dinosaur:
 
     def get_mask(self):
         """Retorna uma máscara de colisão para detecção precisa"""
-        # Otimização: cria a máscara apenas quando a imagem muda
-        if self._mask is None or self._last_image != self.image:
-            self._mask = pygame.mask.from_surface(self.image)
-            self._last_image = self.image
-        return self._mask
+        # Máscaras pré-calculadas no atlas
+        return self.settings.atlas.masks[self.frame]
 
     def check_collision(self, obstacle):
-        """Verifica colisão com obstáculo usando máscara (pixel-perfect)"""
-        dino_mask = self.get_mask()
-        obstacle_mask = obstacle.get_mask()
-
+        """Verifica colisão pixel-perfect com obstáculo (consulta à tabela pré-calculada)"""
         # Calcular offset entre os dois objetos
-        offset = (
-            obstacle.rect.x - self.rect.x,
-            obstacle.rect.y - self.rect.y
-        )
+        offset_x = obstacle.rect.x - self.rect.x
+        offset_y = obstacle.rect.y - self.rect.y
 
-        # Verificar sobreposição de máscaras
-        collision_point = dino_mask.overlap(obstacle_mask, offset)
-        return collision_point is not None
+        return self.settings.collision_table.collides(self.frame, obstacle.frame, offset_x, offset_y)
@@ -0,0 +1,228 @@
+import os
+import pickle
+import queue
+import random
+import secrets
+import tempfile
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+# Chave compartilhada entre o coordenador e os trabalhadores
+AUTHKEY_VARIABLE = 'DINOPY_AUTHKEY'
+
+
+def parse_address(address):
+    """'host:porta' (TCP, padrão 127.0.0.1) ou 'unix:/caminho' -> (família, endereço)"""
+    if address.startswith('unix:'):
+        return 'AF_UNIX', address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    return 'AF_INET', (host or '127.0.0.1', int(port))
+
+
+def read_authkey(generate=False):
+    """Chave de DINOPY_AUTHKEY; sem ela, sorteia uma (generate) ou falha"""
+    key = os.environ.get(AUTHKEY_VARIABLE)
+    if key:
+        return key.encode()
+    if not generate:
+        raise RuntimeError(f"Defina {AUTHKEY_VARIABLE} com a chave do coordenador")
+    key = secrets.token_hex(16)
+    print(f"Chave dos trabalhadores: {AUTHKEY_VARIABLE}={key}")
+    return key.encode()
+
+
+class DistributedEvaluator:
+    """Coordenador: distribui os genomas de cada geração entre trabalhadores remotos
+
+    Trabalhadores (run_worker) se conectam por TCP ou socket unix e se
+    autenticam com a chave compartilhada (desafio HMAC de
+    multiprocessing.connection, nos dois sentidos) antes de qualquer pickle
+    ser lido. Depois recebem
+    os parâmetros do config.txt uma vez e depois lotes de genomas com a
+    semente dos obstáculos, devolvendo o fitness de cada um. Trabalhadores
+    podem entrar a qualquer momento; se um cai (ou não responde dentro de
+    `timeout` segundos), o lote que estava com ele volta para a fila. Como
+    em ParallelEvaluator, o fitness não depende de quem avaliou cada lote.
+
+        evaluator = DistributedEvaluator('config.txt', '0.0.0.0:5005', seed=42)
+        population.run(evaluator.evaluate, 50)
+
+    Sem `authkey` vale DINOPY_AUTHKEY; sem a variável, uma chave é sorteada
+    e mostrada para ser passada aos trabalhadores.
+    """
+
+    def __init__(self, config_path, address, seed=None, chunk_size=None, timeout=None,
+                 fast_forward=False, max_ticks=None, authkey=None):
+        # Semente fixa, ou None para sortear uma nova semente a cada geração
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+
+        # Enviado a cada trabalhador ao se conectar
+        with open(config_path) as f:
+            self.hello = {'config': f.read(), 'fast_forward': fast_forward, 'max_ticks': max_ticks}
+
+        # Lotes a avaliar: (geração, índice, semente, genomas); None encerra um trabalhador
+        self.tasks = queue.Queue()
+        # Resultados: (geração, índice, [(genome_id, fitness)])
+        self.results = queue.Queue()
+        self.generation = 0
+        self.workers = 0
+        self.lock = threading.Lock()
+        self.closed = False
+
+        family, sock_address = parse_address(address)
+        if family == 'AF_UNIX' and os.path.exists(sock_address):
+            os.remove(sock_address)
+        if authkey is None:
+            authkey = read_authkey(generate=True)
+        # O Listener remove o socket unix ao ser fechado
+        self.server = Listener(sock_address, family, backlog=16, authkey=authkey)
+        self.address = address
+        print(f"Coordenador aguardando trabalhadores em {address}")
+
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        """Aceita trabalhadores enquanto o coordenador estiver aberto"""
+        while not self.closed:
+            try:
+                connection = self.server.accept()
+            except (AuthenticationError, EOFError, ConnectionError) as error:
+                # Sem a chave certa nenhuma mensagem é aceita
+                print(f"Conexão recusada: {error}")
+                continue
+            except OSError:
+                break
+            peer = self.server.last_accepted or 'local'
+            threading.Thread(target=self._serve, args=(connection, peer), daemon=True).start()
+
+    def _serve(self, connection, peer):
+        """Conversa com um trabalhador: entrega lotes e recolhe resultados"""
+        with self.lock:
+            self.workers += 1
+        print(f"Trabalhador conectado: {peer}")
+        task = None
+        try:
+            connection.send(self.hello)
+            while True:
+                task = self.tasks.get()
+                if task is None:
+                    connection.send(None)
+                    break
+                generation, index, seed, chunk = task
+                connection.send((seed, chunk))
+                if not connection.poll(self.timeout):
+                    raise TimeoutError("sem resposta")
+                results = connection.recv()
+                self.results.put((generation, index, results))
+                task = None
+        except (OSError, EOFError, pickle.UnpicklingError) as error:
+            print(f"Trabalhador perdido ({peer}): {str(error) or type(error).__name__}")
+            if task is not None:
+                # Devolver o lote para que outro trabalhador o avalie
+                self.tasks.put(task)
+        finally:
+            connection.close()
+            with self.lock:
+                self.workers -= 1
+
+    def split(self, genomes):
+        """Divide os genomas em lotes (por padrão, 4 por trabalhador conectado)"""
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = max(1, len(genomes) // (max(self.workers, 1) * 4))
+        return [genomes[i:i + chunk_size] for i in range(0, len(genomes), chunk_size)]
+
+    def evaluate(self, genomes, config):
+        """Função de avaliação compatível com neat.Population.run"""
+        seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        genomes = list(genomes)
+        by_id = dict(genomes)
+
+        # Resultados de gerações anteriores (lotes repetidos) são descartados
+        self.generation += 1
+        chunks = self.split(genomes)
+        for index, chunk in enumerate(chunks):
+            self.tasks.put((self.generation, index, seed, chunk))
+
+        pending = set(range(len(chunks)))
+        waiting_since = time.monotonic()
+        while pending:
+            try:
+                generation, index, results = self.results.get(timeout=1.0)
+            except queue.Empty:
+                if self.workers == 0 and time.monotonic() - waiting_since > 10:
+                    print(f"Nenhum trabalhador conectado em {self.address}; aguardando...")
+                    waiting_since = time.monotonic()
+                continue
+            if generation != self.generation or index not in pending:
+                continue
+            pending.discard(index)
+            for genome_id, fitness in results:
+                by_id[genome_id].fitness = fitness
+
+    def close(self):
+        """Encerra os trabalhadores conectados e o socket do coordenador"""
+        if self.closed:
+            return
+        self.closed = True
+        for _ in range(self.workers):
+            self.tasks.put(None)
+        self.server.close()
+
+
+def run_worker(address, retry=5.0, authkey=None):
+    """Trabalhador: conecta ao coordenador e avalia lotes até ser encerrado
+
+    Se o coordenador ainda não existe ou a conexão cai, tenta de novo a
+    cada `retry` segundos (None desiste na primeira falha). Sem `authkey`
+    vale DINOPY_AUTHKEY; uma chave recusada encerra o trabalhador.
+    Retorna o código de saída: 0 no fim do treino, 1 com a chave recusada.
+    """
+    # Importação tardia: evita import circular quando main.py roda como script
+    from main import Game, load_config
+
+    family, sock_address = parse_address(address)
+    if authkey is None:
+        authkey = read_authkey()
+    game = None
+    config = None
+    while True:
+        try:
+            with Client(sock_address, family, authkey=authkey) as connection:
+                hello = connection.recv()
+
+                # O config.txt do coordenador é gravado em um arquivo temporário
+                with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+                    f.write(hello['config'])
+                try:
+                    config = load_config(f.name)
+                finally:
+                    os.remove(f.name)
+                if game is None:
+                    game = Game(headless=True)
+                game.fast_forward = hello['fast_forward']
+                game.max_ticks = hello['max_ticks']
+                print(f"Conectado ao coordenador em {address}")
+
+                while True:
+                    task = connection.recv()
+                    if task is None:
+                        print("Coordenador encerrou o treino")
+                        return 0
+                    seed, chunk = task
+                    game.seed = seed
+                    game.eval_genomes(chunk, config)
+                    connection.send([(genome_id, genome.fitness) for genome_id, genome in chunk])
+        except AuthenticationError:
+            print(f"Chave recusada pelo coordenador em {address}: confira {AUTHKEY_VARIABLE}")
+            return 1
+        except (OSError, EOFError) as error:
+            if retry is None:
+                raise
+            print(f"Sem conexão com {address} ({str(error) or type(error).__name__}); "
+                  f"nova tentativa em {retry:.0f}s")
+            time.sleep(retry)
@@ -0,0 +1,112 @@
+import hashlib
+from collections import OrderedDict
+import neat
+from neat.graphs import feed_forward_layers
+
+
+def network_key(genome, config):
+    """Hash da rede efetiva do genoma (o que BatchNetwork.create compila)
+
+    Entram só as conexões habilitadas e os nós necessários para as saídas,
+    com pesos, bias, response e ativação em representação exata
+    (float.hex). As conexões de cada nó ficam na ordem do genoma, pois é a
+    ordem da soma: a mesma rede com outra ordem pode diferir no último bit.
+    """
+    genome_config = config.genome_config
+    input_keys = genome_config.input_keys
+    output_keys = genome_config.output_keys
+
+    connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+    parts = []
+    for layer in feed_forward_layers(input_keys, output_keys, connections):
+        for node in sorted(layer):
+            ng = genome.nodes[node]
+            links = ','.join(f'{inode}:{genome.connections[(inode, onode)].weight.hex()}'
+                             for inode, onode in connections if onode == node)
+            parts.append(f'{node} {ng.activation} {ng.bias.hex()} {ng.response.hex()} [{links}]')
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+class FitnessCache:
+    """Cache LRU de fitness por (rede efetiva, semente, contexto)
+
+    Com obstáculos de semente fixa o fitness de um genoma só depende da
+    sua rede, então elites e clones (que diferem só em conexões
+    desabilitadas) não precisam ser simulados de novo. wrap() envolve
+    uma função de avaliação do NEAT para que só genomas fora do cache, e
+    uma única cópia de cada rede repetida, cheguem ao simulador.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Última avaliação: (genomas com fitness do cache, total de genomas)
+        self.last = (0, 0)
+
+    def get(self, key):
+        """Fitness guardado para a chave (None se ausente)"""
+        fitness = self.entries.get(key)
+        if fitness is not None:
+            self.entries.move_to_end(key)
+        return fitness
+
+    def put(self, key, fitness):
+        """Guarda o fitness, descartando o uso mais antigo se cheio"""
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def wrap(self, evaluate, seed, context=None):
+        """Função de avaliação com cache; sem semente (avaliação
+        aleatória) devolve a própria evaluate"""
+        if seed is None:
+            return evaluate
+
+        def cached_evaluate(genomes, config):
+            genomes = list(genomes)
+            pending = []       # Genomas que precisam ser simulados
+            keys = {}          # genome_id -> chave
+            copies = {}        # chave -> genomas repetidos que esperam o resultado
+            for genome_id, genome in genomes:
+                key = (network_key(genome, config), seed, context)
+                keys[genome_id] = key
+                fitness = self.get(key)
+                if fitness is not None:
+                    genome.fitness = fitness
+                    self.hits += 1
+                elif key in copies:
+                    copies[key].append(genome)
+                    self.hits += 1
+                else:
+                    copies[key] = []
+                    pending.append((genome_id, genome))
+                    self.misses += 1
+
+            if pending:
+                evaluate(pending, config)
+
+            for genome_id, genome in pending:
+                key = keys[genome_id]
+                self.put(key, genome.fitness)
+                for copy in copies[key]:
+                    copy.fitness = genome.fitness
+
+            self.last = (len(genomes) - len(pending), len(genomes))
+
+        return cached_evaluate
+
+
+class CacheReporter(neat.reporting.BaseReporter):
+    """Mostra a cada geração quantos genomas tiveram o fitness do cache"""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def post_evaluate(self, config, population, species, best_genome):
+        cached, total = self.cache.last
+        lookups = self.cache.hits + self.cache.misses
+        rate = self.cache.hits / lookups if lookups else 0.0
+        print(f"Fitness em cache: {cached} de {total} genomas ({rate:.0%} no total do treino)")
@@ -1,5 +1,8 @@
 import pygame
 import os
+from sprite_atlas import SpriteAtlas
+from collision import CollisionTable
+from trajectory import JumpTable
 
 
 class Settings:
@@ -33,35 +36,67 @@ class Settings:
         self.LARGE_CACTUS = None
         self.BIRD = None
 
+        # Atlas com máscaras pré-calculadas e os índices de cada grupo de quadros
+        self.atlas = None
+        self.RUNNING_FRAMES = None
+        self.JUMPING_FRAME = None
+        self.DUCKING_FRAMES = None
+        self.SMALL_CACTUS_FRAMES = None
+        self.LARGE_CACTUS_FRAMES = None
+        self.BIRD_FRAMES = None
+
+        # Tabelas de colisão entre quadros (cache em Assets/)
+        self.collision_table = None
+
+        # Fatores e arcos do pulo para cada velocidade
+        self.jump_table = None
+
+    @staticmethod
+    def load_image(folder, name):
+        """Carrega um PNG; com uma janela aberta, converte para o formato do display
+
+        Sem display (modo headless, processos trabalhadores) a superfície fica
+        no formato do arquivo, que basta para as máscaras e as colisões.
+        """
+        image = pygame.image.load(os.path.join("Assets", folder, name))
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        return image
+
     def load_images(self):
         """Carrega todas as imagens do jogo"""
         # Imagens do dinossauro
-        self.RUNNING = [
-            pygame.image.load(os.path.join("Assets/Dino", "DinoRun1.png")),
-            pygame.image.load(os.path.join("Assets/Dino", "DinoRun2.png"))
-        ]
+        self.RUNNING = [self.load_image("Dino", "DinoRun1.png"), self.load_image("Dino", "DinoRun2.png")]
+        self.JUMPING = self.load_image("Dino", "DinoJump.png")
+        self.DUCKING = [self.load_image("Dino", "DinoDuck1.png"), self.load_image("Dino", "DinoDuck2.png")]
 
-        self.JUMPING = pygame.image.load(os.path.join("Assets/Dino", "DinoJump.png"))
+        # Imagens dos obstáculos
+        self.SMALL_CACTUS = [self.load_image("Cactus", f"SmallCactus{n}.png") for n in (1, 2, 3)]
+        self.LARGE_CACTUS = [self.load_image("Cactus", f"LargeCactus{n}.png") for n in (1, 2, 3)]
+        self.BIRD = [self.load_image("Bird", "Bird1.png"), self.load_image("Bird", "Bird2.png")]
 
-        self.DUCKING = [
-            pygame.image.load(os.path.join("Assets/Dino", "DinoDuck1.png")),
-            pygame.image.load(os.path.join("Assets/Dino", "DinoDuck2.png"))
-        ]
+        # Construir o atlas uma única vez (máscaras nunca são recriadas no jogo)
+        self.atlas = SpriteAtlas(
+            self.RUNNING + [self.JUMPING] + self.DUCKING +
+            self.SMALL_CACTUS + self.LARGE_CACTUS + self.BIRD
+        )
+        self.RUNNING_FRAMES = self.atlas.indices(self.RUNNING)
+        self.JUMPING_FRAME = self.atlas.indices([self.JUMPING])[0]
+        self.DUCKING_FRAMES = self.atlas.indices(self.DUCKING)
+        self.SMALL_CACTUS_FRAMES = self.atlas.indices(self.SMALL_CACTUS)
+        self.LARGE_CACTUS_FRAMES = self.atlas.indices(self.LARGE_CACTUS)
+        self.BIRD_FRAMES = self.atlas.indices(self.BIRD)
 
-        # Imagens dos obstáculos
-        self.SMALL_CACTUS = [
-            pygame.image.load(os.path.join("Assets/Cactus", "SmallCactus1.png")),
-            pygame.image.load(os.path.join("Assets/Cactus", "SmallCactus2.png")),
-            pygame.image.load(os.path.join("Assets/Cactus", "SmallCactus3.png"))
-        ]
-
-        self.LARGE_CACTUS = [
-            pygame.image.load(os.path.join("Assets/Cactus", "LargeCactus1.png")),
-            pygame.image.load(os.path.join("Assets/Cactus", "LargeCactus2.png")),
-            pygame.image.load(os.path.join("Assets/Cactus", "LargeCactus3.png"))
-        ]
-
-        self.BIRD = [
-            pygame.image.load(os.path.join("Assets/Bird", "Bird1.png")),
-            pygame.image.load(os.path.join("Assets/Bird", "Bird2.png"))
-        ]
+        # Tabelas de colisão pré-calculadas (lidas do cache quando os PNGs não mudaram)
+        self.collision_table = CollisionTable.load(
+            self.atlas,
+            self.dino_frames(),
+            self.SMALL_CACTUS_FRAMES + self.LARGE_CACTUS_FRAMES + self.BIRD_FRAMES
+        )
+
+        # Fatores e arcos do pulo calculados uma vez para todas as velocidades
+        self.jump_table = JumpTable(self)
+
+    def dino_frames(self):
+        """Todos os quadros do atlas usados pelo dinossauro"""
+        return self.RUNNING_FRAMES + (self.JUMPING_FRAME,) + self.DUCKING_FRAMES
@@ -2,38 +2,101 @@
 import pygame
 import os
 import sys
-import random
 import neat
 from dinosaur import Dinosaur
-from obstacles import SmallCactus, LargeCactus, Bird
+from population import DinosaurPopulation
+from batch_network import BatchNetwork
+from observation import Observation
+from obstacles import SmallCactus, LargeCactus, Bird, ObstaclePool
+from obstacle_schedule import ObstacleSchedule, SMALL_CACTUS, LARGE_CACTUS
 from game_settings import Settings
-from visualization import plot_stats, draw_neural_network
+from profiler import ProfileCapture
+from checkpoint import AsyncWriter, Checkpointer, restore
+from stats_log import StatsLog
+from compiled_network import CompiledNetwork
+import copy
+import gc
 import pickle
+import signal
+import numpy as np
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, seed=None, spectate_every=None, spectate_top=10):
+        # Modo headless: sem janela, sem desenho e sem limite de framerate
+        self.headless = headless
+        if self.headless:
+            # Driver de vídeo "dummy" permite rodar em servidores sem monitor
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+        # Semente dos obstáculos (None = sequência aleatória a cada geração)
+        self.seed = seed
+
         self.settings = Settings()
-        self.screen = pygame.display.set_mode((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
-        pygame.display.set_caption("T-Rex Runner NEAT")
+        self.schedule = ObstacleSchedule(self.settings, self.seed)
+        if self.headless:
+            # Sem janela: só a fonte é inicializada e a tela é uma superfície comum
+            pygame.font.init()
+            self.screen = pygame.Surface((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
+            pygame.display.set_caption("T-Rex Runner NEAT")
         self.clock = pygame.time.Clock()
 
         # Carregar recursos uma única vez
         self.load_resources()
 
+        # Obstáculos que saíram da tela, reaproveitados nas próximas gerações
+        self.obstacle_pool = ObstaclePool(self.settings.atlas)
+
         # Estatísticas do jogo
         self.points = 0
         self.obstacles = []
         self.dinosaurs = []
         self.ge = []
-        self.nets = []
+        self.net = None
         self.generation_threshold = 10000
 
+        # Limite opcional de ticks por geração (usado pelos benchmarks)
+        self.max_ticks = None
+
+        # Perfil por fase dos ticks (TickProfiler, ativado em run_neat)
+        self.profiler = None
+
+        # Avançar de uma vez os ticks sem decisões possíveis (só sem desenho;
+        # desativado por padrão: em populações reais quase sempre alguém age)
+        self.fast_forward = False
+        # Após tentativas frustradas, esperar cada vez mais antes de tentar de novo
+        self.quiet_backoff = 0
+        self.quiet_retry_at = 0
+
+        # Escritas em disco (checkpoints, melhor genoma) fora do laço do jogo
+        self.writer = AsyncWriter()
+
+        # Captura do cProfile sob demanda: tecla P ou SIGUSR1 (modo headless)
+        self.capture = ProfileCapture()
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, self.capture.request)
+
+        # População do NEAT (definida em run_neat, usada só no HUD)
+        self.population = None
+
         # Background
         self.x_pos_bg = 0
         self.y_pos_bg = 380
 
+        # Modo espectador: simulação sem limite de framerate, desenhando só
+        # os melhores dinossauros a cada spectate_every ticks
+        self.spectator = None
+        if spectate_every and not self.headless:
+            from spectator import Spectator
+
+            self.spectator = Spectator(
+                self.screen, self.settings, self.font, self.bg_image, self.y_pos_bg,
+                every=spectate_every, top_k=spectate_top
+            )
+
     def load_resources(self):
         """Carrega todos os recursos do jogo (imagens, sons)"""
         self.settings.load_images()
@@ -44,7 +107,7 @@ class Game:
         self.large_font = pygame.font.Font('freesansbold.ttf', 30)
 
         # Carregar fundo
-        self.bg_image = pygame.image.load(os.path.join("Assets/Other", "Track.png"))
+        self.bg_image = self.settings.load_image("Other", "Track.png")
 
     def draw_background(self):
         """Desenha o fundo em movimento"""
@@ -59,11 +122,13 @@ class Game:
     def draw_statistics(self):
         """Mostra estatísticas do jogo na tela"""
         text_1 = self.font.render(f'Dinossauros Vivos: {str(len(self.dinosaurs))}', True, (0, 0, 0))
-        text_2 = self.font.render(f'Geração: {self.population.generation + 1}', True, (0, 0, 0))
+        generation = self.population.generation + 1 if self.population else 1
+        text_2 = self.font.render(f'Geração: {generation}', True, (0, 0, 0))
         text_3 = self.font.render(f"Velocidade: {self.settings.game_speed:.1f}", True, (0, 0, 0))
 
         # Adicionar mais informações úteis
-        highest_fitness = max([genome.fitness for genome in self.ge]) if self.ge else 0
+        alive_fitness = self.dinosaurs.fitness[self.dinosaurs.alive]
+        highest_fitness = alive_fitness.max() if len(alive_fitness) else 0
         text_4 = self.font.render(f'Maior Fitness: {highest_fitness:.2f}', True, (0, 0, 0))
 
         self.screen.blit(text_1, (50, 450))
@@ -72,7 +137,7 @@ class Game:
         self.screen.blit(text_4, (50, 540))
 
     def update_score(self):
-        """Atualiza e mostra a pontuação"""
+        """Atualiza a pontuação e a velocidade do jogo"""
         self.points += 1 #Original é 1
 
         # Aumentar a velocidade progressivamente (ajustado para ser menos abrupto)
@@ -82,436 +147,614 @@ class Game:
             if self.settings.game_speed < self.settings.MAX_GAME_SPEED:
                 self.settings.game_speed += 0.1 #original 0.5
 
-        # Mostrar pontuação
+    def draw_score(self):
+        """Mostra a pontuação"""
         score_text = self.font.render(f'Pontos: {str(self.points)}', True, (0, 0, 0))
         self.screen.blit(score_text, (950, 50))
 
     def generate_obstacles(self):
-        """Gera novos obstáculos com base na pontuação atual"""
+        """Gera o próximo obstáculo da sequência quando a tela fica vazia"""
         if len(self.obstacles) == 0:
-            # Determinar quais tipos de obstáculos podem aparecer
-            available_obstacles = []
-
-            # Cactos sempre estão disponíveis
-            available_obstacles.append(0)  # Small Cactus
-            available_obstacles.append(1)  # Large Cactus
-
-            # Pássaros aparecem apenas após certa pontuação
-            if self.points >= self.settings.BIRD_INTRODUCTION_SCORE:
-                available_obstacles.append(2)  # Bird
-
-            # Escolher aleatoriamente entre os obstáculos disponíveis
-            # Controle de frequência: mais cactos no início, mais pássaros depois
-            if self.points > 1000:
-                # Aumentar chance de pássaros em pontuações mais altas
-                chance_modifier = min(0.4, (self.points - 1000) / 5000)
-                weights = [0.3 - chance_modifier / 2, 0.3 - chance_modifier / 2, 0.4 + chance_modifier]
+            record = self.schedule.next(self.points, self.settings.game_speed)
+
+            # Adicionar o obstáculo sorteado (reaproveitado do pool quando possível)
+            pool = self.obstacle_pool
+            if record.kind == SMALL_CACTUS:
+                obstacle = pool.acquire(SmallCactus, self.settings.SMALL_CACTUS_FRAMES, record.variant)
+            elif record.kind == LARGE_CACTUS:
+                obstacle = pool.acquire(LargeCactus, self.settings.LARGE_CACTUS_FRAMES, record.variant)
             else:
-                weights = [0.4, 0.4, 0.2]
-
-            # Filtrando pesos para apenas obstáculos disponíveis
-            final_weights = []
-            final_obstacles = []
-
-            for i, obstacle_type in enumerate(available_obstacles):
-                if i < len(weights):
-                    final_weights.append(weights[i])
-                    final_obstacles.append(obstacle_type)
-
-            # Normalizar pesos
-            total = sum(final_weights)
-            final_weights = [w / total for w in final_weights]
-
-            rand_int = random.choices(final_obstacles, weights=final_weights, k=1)[0]
-
-            # Adicionar o obstáculo escolhido
-            if rand_int == 0:
-                self.obstacles.append(SmallCactus(
-                    self.settings.SMALL_CACTUS,
-                    random.randint(0, 2)
-                ))
-            elif rand_int == 1:
-                self.obstacles.append(LargeCactus(
-                    self.settings.LARGE_CACTUS,
-                    random.randint(0, 2)
-                ))
-            elif rand_int == 2:
-                self.obstacles.append(Bird(
-                    self.settings.BIRD,
-                    height_type=random.randint(0, 2)  # Diferentes alturas para o pássaro
-                ))
-
-            # Adicionar distância mínima entre obstáculos baseada na velocidade
-            min_distance = 50 + (self.settings.game_speed * 5)
-
-            # Ajustar posição X do obstáculo para garantir distância mínima
-            self.obstacles[-1].rect.x = self.settings.SCREEN_WIDTH + min_distance
+                obstacle = pool.acquire(Bird, self.settings.BIRD_FRAMES, record.bird_height)
+
+            # Posicionar o obstáculo após a distância mínima
+            obstacle.rect.x = self.settings.SCREEN_WIDTH + record.gap
+            self.obstacles.append(obstacle)
+
+    def clear_obstacles(self):
+        """Devolve ao pool os obstáculos em jogo e esvazia a lista"""
+        for obstacle in self.obstacles:
+            self.obstacle_pool.release(obstacle)
+        self.obstacles.clear()
 
     def remove_dinosaur(self, index):
-        """Remove um dinossauro e seus dados associados quando ele colide"""
-        self.dinosaurs.pop(index)
-        self.ge.pop(index)
-        self.nets.pop(index)
+        """Marca como mortos os dinossauros que colidiram e penaliza seus genomas"""
+        self.dinosaurs.fitness[index] -= 1
+        self.dinosaurs.kill(index)
+
+    def handle_events(self):
+        """Trata os eventos da janela; retorna False quando ESC encerra a geração"""
+        run = True
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    run = False
+                elif event.key == pygame.K_s:
+                    # Salvar o melhor genoma
+                    self.save_best_genome()
+                elif event.key == pygame.K_p:
+                    # Capturar um perfil dos próximos ticks
+                    self.capture.request()
+        return run
 
     def eval_genomes(self, genomes, config):
         """Função principal de avaliação dos genomas"""
+        # Genomas e demais objetos já criados vivem a geração inteira:
+        # congelados, saem das varreduras do coletor de lixo até o fim dela
+        gc.freeze()
+        try:
+            # Configurar os genomas e as redes (todas compiladas em um único lote)
+            self.ge = []
+            for genome_id, genome in genomes:
+                self.ge.append(genome)
+                genome.fitness = 0
+            self.simulate(BatchNetwork.create(self.ge, config))
+
+            # Copiar o fitness acumulado para os genomas
+            self.sync_fitness()
+        finally:
+            # Devolver os objetos ao coletor (o que a geração descartou é liberado)
+            gc.unfreeze()
+
+    def simulate(self, net):
+        """Joga uma geração com redes já compiladas (um dinossauro por linha de net)
+
+        Usado por eval_genomes e pelos trabalhadores que recebem as redes
+        prontas em memória compartilhada. Retorna o fitness de cada linha.
+        Quem chama congela o coletor de lixo em volta da geração (gc.freeze).
+        """
         self.points = 0
-        self.obstacles = []
-        self.dinosaurs = []
-        self.ge = []
-        self.nets = []
-        self.population = neat.Population(config) if not hasattr(self, 'population') else self.population
+        self.clear_obstacles()
 
-        # Reiniciar a velocidade do jogo
+        # Reiniciar a velocidade do jogo, a sequência de obstáculos e o avanço rápido
         self.settings.game_speed = self.settings.INITIAL_GAME_SPEED
+        self.schedule = ObstacleSchedule(self.settings, self.seed)
+        self.quiet_backoff = 0
+        self.quiet_retry_at = 0
+
+        # Estado de todos os dinossauros em arrays (um por rede)
+        self.net = net
+        self.dinosaurs = DinosaurPopulation(net.size, self.settings)
+        self.observation = Observation(self.settings, net.size)
 
-        # Configurar os genomas e redes
-        for genome_id, genome in genomes:
-            self.dinosaurs.append(Dinosaur(self.settings.RUNNING[0], self.settings))
-            self.ge.append(genome)
-            net = neat.nn.FeedForwardNetwork.create(genome, config)
-            self.nets.append(net)
-            genome.fitness = 0
+        # Desenho completo a cada tick só no modo normal (nem headless, nem espectador)
+        draw = not self.headless and self.spectator is None
+
+        # Cronômetro por fase (None quando o perfil está desativado)
+        profiler = self.profiler
+        if profiler:
+            profiler.start()
+
+        # Avanço rápido só sem nenhum desenho; depois de cada avanço ao menos
+        # um tick é simulado normalmente (o tick em que alguém age)
+        fast_forward = self.fast_forward and self.headless
+        quiet = fast_forward
 
         run = True
         while run:
-            # Verificar eventos
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        run = False
-                    elif event.key == pygame.K_s:
-                        # Salvar o melhor genoma
-                        self.save_best_genome()
-
-            # Limpar a tela
-            self.screen.fill((255, 255, 255))
+            # Pular de uma vez os ticks em que nenhuma decisão muda o resultado
+            if quiet and not (self.capture.pending or self.capture.profile is not None):
+                skipped = self.skip_quiet_ticks()
+                if skipped:
+                    if profiler:
+                        for _ in range(skipped):
+                            profiler.tick(len(self.dinosaurs))
+                        profiler.mark('fast_forward')
+                    quiet = False
+                    continue
+            quiet = fast_forward
+
+            # Verificar eventos (não há janela no modo headless)
+            if draw:
+                run = self.handle_events()
+                if profiler:
+                    profiler.mark('events')
+
+                # Limpar a tela
+                self.screen.fill((255, 255, 255))
+                if profiler:
+                    profiler.mark('drawing')
 
             # Atualizar e desenhar dinossauros
-            for dinosaur in self.dinosaurs:
-                dinosaur.update()
-                dinosaur.draw(self.screen)
+            self.dinosaurs.update()
+            if profiler:
+                profiler.mark('dinosaurs')
+            if draw:
+                self.dinosaurs.draw(self.screen)
+                if profiler:
+                    profiler.mark('drawing')
 
             # Verificar se todos os dinossauros morreram
-            if len(self.dinosaurs) == 0:
+            alive = len(self.dinosaurs)
+            if alive == 0:
                 break
 
             # Mata os dinossauros ao chegar em 10k
             # if self.points >= self.generation_threshold:
             #     break
 
+            # Encerrar a geração no limite de ticks, se houver
+            if self.max_ticks is not None and self.points >= self.max_ticks:
+                break
+            if profiler:
+                profiler.tick(alive)
+
+            # Captura do cProfile pedida pela tecla P ou por SIGUSR1
+            capture = self.capture
+            if capture.pending or capture.profile is not None:
+                generation = self.population.generation if self.population else 0
+                capture.tick(generation, self.points)
+
                 # Gerar obstáculos se necessário
             self.generate_obstacles()
-
-            # Atualizar e desenhar obstáculos
-            for obstacle in list(self.obstacles):  # Usar uma cópia para evitar modificação durante iteração
-                obstacle.draw(self.screen)
+            if profiler:
+                profiler.mark('obstacles')
+
+            # Desenhar obstáculos (na posição antes do movimento)
+            if draw:
+                for obstacle in self.obstacles:
+                    obstacle.draw(self.screen)
+                if profiler:
+                    profiler.mark('drawing')
+
+            # Atualizar obstáculos (por índice, sem copiar a lista a cada tick)
+            obstacles = self.obstacles
+            i = 0
+            while i < len(obstacles):
+                obstacle = obstacles[i]
                 obstacle.update(self.settings.game_speed)
 
                 # Remover obstáculos que saíram da tela
                 if obstacle.rect.x < -obstacle.rect.width:
-                    self.obstacles.remove(obstacle)
-                    continue
-
-                # Verificar colisões
-                for i, dinosaur in enumerate(list(self.dinosaurs)):  # Usar uma cópia para evitar problemas
-                    if i >= len(self.ge):  # Verificação de segurança
-                        continue
+                    self.obstacle_pool.release(obstacles.pop(i))
+                else:
+                    i += 1
+            if profiler:
+                profiler.mark('obstacles')
 
-                    if dinosaur.check_collision(obstacle):
-                        # Penalizar por colisão
-                        self.ge[i].fitness -= 1
-                        self.remove_dinosaur(i)
-                        break  # Sair do loop interno após remover
+            # Verificar colisões: todos os dinossauros que colidem morrem no
+            # mesmo tick, assim o fitness de um genoma não depende dos outros
+            # genomas avaliados junto
+            for obstacle in self.obstacles:
+                self.remove_dinosaur(self.dinosaurs.check_collision(obstacle))
+            if profiler:
+                profiler.mark('collision')
 
             # Atualizar redes neurais
             self.update_neural_networks()
 
+            # Sem desenho completo só a lógica de pontuação é executada
+            if not draw:
+                self.update_score()
+
+                # O espectador desenha (e trata eventos) só a cada N ticks
+                if self.spectator is not None and self.spectator.due():
+                    run = self.handle_events()
+                    if profiler:
+                        profiler.mark('events')
+                    self.spectator.render(self)
+                    if profiler:
+                        profiler.mark('drawing')
+                continue
+
             # Desenhar informações do jogo
             self.draw_statistics()
             self.update_score()
+            self.draw_score()
             self.draw_background()
+            if profiler:
+                profiler.mark('drawing')
 
             # Limitação de framerate para consistência
             self.clock.tick(30)
+            if profiler:
+                profiler.mark('framerate')
             pygame.display.update()
+            if profiler:
+                profiler.mark('display')
+
+        return self.dinosaurs.fitness
+
+    def skip_quiet_ticks(self, limit=48):
+        """Avança vários ticks de uma vez quando nada pode mudar o resultado
+
+        Vale quando todos os dinossauros vivos estão correndo e o único
+        obstáculo ainda está longe: não há colisão possível, as entradas das
+        redes são as mesmas para todos e podem ser previstas tick a tick, e
+        as redes de todos os ticks são avaliadas em uma única chamada. Os
+        ticks antes do primeiro em que alguma rede agiria (pular, agachar)
+        são aplicados com as mesmas operações do laço normal, na mesma
+        ordem, então o fitness é idêntico. Retorna o número de ticks
+        avançados (0 quando o próximo tick precisa ser simulado).
+        """
+        if self.points < self.quiet_retry_at or len(self.obstacles) != 1:
+            return 0
+        dinosaurs = self.dinosaurs
+        alive = dinosaurs.alive_indices()
+        if len(alive) == 0 or dinosaurs.jumping[alive].any() or dinosaurs.ducking[alive].any():
+            return 0
+        if self.max_ticks is not None:
+            limit = min(limit, self.max_ticks - self.points)
+
+        # Simular o obstáculo em uma cópia para prever as entradas de cada tick
+        obstacle = self.obstacles[0]
+        preview = copy.copy(obstacle)
+        preview.rect = obstacle.rect.copy()
+        is_bird = isinstance(obstacle, Bird)
+
+        settings = self.settings
+        game_speed = settings.game_speed
+        speed, points = game_speed, self.points
+        y = np.array([dinosaurs.NORMAL_Y])
+        state = np.zeros(1, dtype=bool)
+        rows = []
+        for _ in range(limit):
+            preview.update(speed)
+            # Fim da janela: colisão possível ou cacto perto o bastante para pular
+            if dinosaurs.collision.reaches(preview) or preview.rect.x <= dinosaurs.X_POS:
+                break
+            if not is_bird and preview.rect.x - dinosaurs.X_POS < 250:
+                break
 
-    def update_neural_networks(self):
-        """Atualiza as redes neurais para cada dinossauro"""
-        for i, dinosaur in enumerate(list(self.dinosaurs)):
-            if i >= len(self.ge):  # Verificação de segurança
-                continue
-
-            # Recompensar o dinossauro por permanecer vivo
-            self.ge[i].fitness += 0.1
+            settings.game_speed = speed
+            self.observation.update_obstacles([preview], dinosaurs.X_POS)
+            rows.append(self.observation.build(y, state, state)[0].copy())
+
+            # Pontuação e velocidade como em update_score
+            points += 1
+            if points % 10 == 0 and speed < settings.MAX_GAME_SPEED:
+                speed += 0.1
+        settings.game_speed = game_speed
+        if not rows:
+            return 0
+
+        # Saídas de todas as redes vivas em todos os ticks da janela
+        outputs = self.net.activate_ticks(np.array(rows), alive)
+        if is_bird and obstacle.rect.y + obstacle.rect.height > dinosaurs.NORMAL_Y - 30:
+            acts = (outputs[:, :, 0] > 0.5).any(axis=1)  # Pássaro baixo: pular (agacha)
+        else:
+            acts = (outputs[:, :, 1] > 0.5).any(axis=1)  # Agachar
+        ticks = int(acts.argmax()) if acts.any() else len(rows)
+        if ticks == 0:
+            # Alguma rede age já no próximo tick: as saídas foram desperdiçadas
+            self.quiet_backoff = min(max(1, self.quiet_backoff * 2), 256)
+            self.quiet_retry_at = self.points + self.quiet_backoff
+            return 0
+        self.quiet_backoff = 0
+
+        # Aplicar os ticks sem ação: corrida, obstáculo, fitness e pontuação
+        step = dinosaurs.step_index[alive]
+        dinosaurs.frame[alive] = dinosaurs.run_frames[((step + ticks - 1) % 10) // 5]
+        dinosaurs.step_index[alive] = (step + ticks) % 10
+        fitness = dinosaurs.fitness[alive]
+        for _ in range(ticks):
+            obstacle.update(settings.game_speed)
+            fitness += 0.1
+            self.update_score()
+        dinosaurs.fitness[alive] = fitness
+        return ticks
 
-            # Encontrar o obstáculo mais próximo
-            closest_obstacle = None
-            closest_distance = float('inf')
+    def sync_fitness(self):
+        """Copia o fitness acumulado na população para os genomas"""
+        for genome, fitness in zip(self.ge, self.dinosaurs.fitness.tolist()):
+            genome.fitness = fitness
 
-            for obstacle in self.obstacles:
-                # Calcular apenas obstáculos que estão à frente do dinossauro
-                if obstacle.rect.x > dinosaur.rect.x:
-                    distance = obstacle.rect.x - dinosaur.rect.x
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_obstacle = obstacle
-
-            # Definir valores padrão caso não haja obstáculos
-            obstacle_type = 0
-            obstacle_width = 0
-            obstacle_height = 0
-            height_diff = 0
-            distance_x = self.settings.SCREEN_WIDTH
-            distance_normalized = 1.0  # Normalizado entre 0 e 1
-            next_obstacle_distance = self.settings.SCREEN_WIDTH * 2  # Distância para o segundo obstáculo
-            game_speed_normalized = self.settings.game_speed / self.settings.MAX_GAME_SPEED
-
-            # Se temos um obstáculo próximo, obter suas informações
-            if closest_obstacle:
-                if isinstance(closest_obstacle, Bird):
-                    obstacle_type = 2
-                elif isinstance(closest_obstacle, LargeCactus):
-                    obstacle_type = 1
-                else:
-                    obstacle_type = 0
-
-                obstacle_width = closest_obstacle.rect.width
-                obstacle_height = closest_obstacle.rect.height
-                height_diff = dinosaur.rect.y - closest_obstacle.rect.y
-                distance_x = closest_obstacle.rect.x - dinosaur.rect.x
-
-                # Normalizar a distância (ajuda a rede neural)
-                distance_normalized = max(0, min(1, distance_x / self.settings.SCREEN_WIDTH))
-
-                # Encontrar a distância para o próximo obstáculo (se houver)
-                if len(self.obstacles) > 1:
-                    next_obstacles = [o for o in self.obstacles if o.rect.x > closest_obstacle.rect.x]
-                    if next_obstacles:
-                        next_obstacle_distance = next_obstacles[0].rect.x - dinosaur.rect.x
-
-            # Inputs expandidos para a rede neural
-            output = self.nets[i].activate((
-                dinosaur.rect.y / self.settings.SCREEN_HEIGHT,  # Altura normalizada
-                distance_normalized,  # Distância normalizada para o obstáculo mais próximo
-                height_diff / self.settings.SCREEN_HEIGHT,  # Diferença de altura normalizada
-                obstacle_width / self.settings.SCREEN_WIDTH,  # Largura do obstáculo normalizada
-                obstacle_height / self.settings.SCREEN_HEIGHT,  # Altura do obstáculo normalizada
-                obstacle_type / 2,  # Tipo de obstáculo normalizado (0, 0.5, ou 1)
-                next_obstacle_distance / (self.settings.SCREEN_WIDTH * 2),  # Distância para o próximo obstáculo
-                game_speed_normalized,  # Velocidade do jogo normalizada
-                dinosaur.jumping / 1,  # Estado atual de pulo (0 ou 1)
-                dinosaur.ducking / 1  # Estado atual de agachamento (0 ou 1)
-            ))
-
-            # Interpretar as saídas da rede neural
-            if closest_obstacle:
-                # Lógica melhorada para pássaros:
-                if isinstance(closest_obstacle, Bird):
-                    # Verificar a altura do pássaro para decidir entre pular ou agachar
-                    bird_y = closest_obstacle.rect.y
-                    bird_height = closest_obstacle.rect.height
-
-                    # Pássaros mais baixos requerem pulo
-                    if bird_y + bird_height > dinosaur.NORMAL_Y - 30:
-                        if output[0] > 0.5 and dinosaur.rect.y == dinosaur.NORMAL_Y and not dinosaur.jumping:
-                            dinosaur.duck()
-                            # Recompensar o pulo correto para pássaros baixos
-                            self.ge[i].fitness += 0.3 #original = 0.3
-                    # Pássaros mais altos requerem agachamento
-                    else:
-                        if output[1] > 0.5 and not dinosaur.jumping:
-                            dinosaur.duck()
-                            # Recompensar o agachamento correto para pássaros altos
-                            self.ge[i].fitness += 0.5 #original = 0.3
-                        elif output[1] <= 0.5 and dinosaur.ducking:
-                            dinosaur.stop_duck()
-                # Lógica para cactos (sempre pular):
+    def update_neural_networks(self):
+        """Atualiza as redes neurais de todos os dinossauros vivos"""
+        dinosaurs = self.dinosaurs
+        alive = dinosaurs.alive_indices()
+
+        # Recompensar os dinossauros por permanecerem vivos
+        dinosaurs.fitness[alive] += 0.1
+
+        # Entradas compartilhadas (obstáculos) uma vez, depois as de cada dinossauro
+        self.observation.update_obstacles(self.obstacles, dinosaurs.X_POS)
+        inputs = self.observation.build(dinosaurs.y[alive], dinosaurs.jumping[alive], dinosaurs.ducking[alive])
+        if self.profiler:
+            self.profiler.mark('observation')
+
+        # Avaliar todas as redes de uma vez
+        outputs = self.net.activate(inputs, alive)
+        jump_output = outputs[:, 0]
+        duck_output = outputs[:, 1]
+
+        closest_obstacle = self.observation.closest_obstacle
+        distance_x = self.observation.distance_x
+
+        # Interpretar as saídas da rede neural
+        if closest_obstacle:
+            # Lógica melhorada para pássaros:
+            if isinstance(closest_obstacle, Bird):
+                # Verificar a altura do pássaro para decidir entre pular ou agachar
+                bird_y = closest_obstacle.rect.y
+                bird_height = closest_obstacle.rect.height
+
+                # Pássaros mais baixos requerem pulo
+                if bird_y + bird_height > dinosaurs.NORMAL_Y - 30:
+                    on_ground = (dinosaurs.y[alive] == dinosaurs.NORMAL_Y) & ~dinosaurs.jumping[alive]
+                    duck = alive[(jump_output > 0.5) & on_ground]
+                    dinosaurs.duck(duck)
+                    # Recompensar o pulo correto para pássaros baixos
+                    dinosaurs.fitness[duck] += 0.3 #original = 0.3
+                # Pássaros mais altos requerem agachamento
                 else:
-                    # Decidir pular baseado na distância e largura do cacto
-                    jump_threshold = max(0.4, 0.7 - (self.settings.game_speed / 100))
-
-                    # Pular apenas se o obstáculo estiver próximo o suficiente
-                    if distance_x < 250 and output[0] > jump_threshold and dinosaur.rect.y == dinosaur.NORMAL_Y:
-                        dinosaur.jump()
-                        # Recompensar por pular obstáculos corretamente
-                        if not isinstance(closest_obstacle, Bird):
-                            self.ge[i].fitness += 0.2
-
-                    # Penalizar por agachar com cactos (deve pular)
-                    if output[1] > 0.5 and not dinosaur.jumping:
-                        dinosaur.duck()
-                        # Pequena penalização por agachar com cactos
-                        self.ge[i].fitness -= 0.05
-                    elif output[1] <= 0.5 and dinosaur.ducking:
-                        dinosaur.stop_duck()
-
-            # Se não há obstáculos próximos, voltar a correr normalmente
+                    duck_mask = (duck_output > 0.5) & ~dinosaurs.jumping[alive]
+                    stop_mask = ~duck_mask & (duck_output <= 0.5) & dinosaurs.ducking[alive]
+                    duck = alive[duck_mask]
+                    dinosaurs.duck(duck)
+                    # Recompensar o agachamento correto para pássaros altos
+                    dinosaurs.fitness[duck] += 0.5 #original = 0.3
+                    dinosaurs.stop_duck(alive[stop_mask])
+            # Lógica para cactos (sempre pular):
             else:
-                if dinosaur.ducking:
-                    dinosaur.stop_duck()
+                # Decidir pular baseado na distância e largura do cacto
+                jump_threshold = max(0.4, 0.7 - (self.settings.game_speed / 100))
+
+                # Pular apenas se o obstáculo estiver próximo o suficiente
+                if distance_x < 250:
+                    jump = alive[(jump_output > jump_threshold) & (dinosaurs.y[alive] == dinosaurs.NORMAL_Y)]
+                    dinosaurs.jump(jump)
+                    # Recompensar por pular obstáculos corretamente
+                    dinosaurs.fitness[jump] += 0.2
+
+                # Penalizar por agachar com cactos (deve pular)
+                duck_mask = (duck_output > 0.5) & ~dinosaurs.jumping[alive]
+                stop_mask = ~duck_mask & (duck_output <= 0.5) & dinosaurs.ducking[alive]
+                duck = alive[duck_mask]
+                dinosaurs.duck(duck)
+                # Pequena penalização por agachar com cactos
+                dinosaurs.fitness[duck] -= 0.05
+                dinosaurs.stop_duck(alive[stop_mask])
+
+        # Se não há obstáculos próximos, voltar a correr normalmente
+        else:
+            dinosaurs.stop_duck(alive[dinosaurs.ducking[alive]])
+
+        if self.profiler:
+            self.profiler.mark('network')
 
     def save_best_genome(self):
         """Salva o melhor genoma da geração atual"""
         if not self.ge:
             return
 
-        best_genome = max(self.ge, key=lambda g: g.fitness)
-
-        with open('best_genome.pkl', 'wb') as f:
-            pickle.dump(best_genome, f)
+        # Atualizar o fitness dos genomas antes de escolher o melhor vivo
+        self.sync_fitness()
+        alive = self.dinosaurs.alive_indices()
+        if len(alive) == 0:
+            return
+        best_genome = self.ge[alive[self.dinosaurs.fitness[alive].argmax()]]
+
+        # Serializar agora (o genoma continua mudando) e gravar em segundo plano
+        self.writer.write('best_genome.pkl', pickle.dumps(best_genome),
+                          message=f"Melhor genoma salvo! Fitness: {best_genome.fitness:.2f}")
+
+    def run_neat(self, config_path, num_generations=50, workers=1, profile=False, cache_size=0,
+                 checkpoint_interval=5, resume=None, coordinator=None, dashboard=False, champions=0):
+        """Executa o algoritmo NEAT (workers > 1 avalia em paralelo; profile
+        mostra e grava em tick_profile.csv o tempo de cada fase do tick;
+        cache_size > 0 guarda o fitness de até cache_size redes)
+
+        Um checkpoint é salvo a cada checkpoint_interval gerações (0 desativa);
+        resume é o caminho de um checkpoint de onde o treino continua até
+        completar num_generations gerações. Com coordinator ('host:porta' ou
+        'unix:/caminho') a avaliação é feita por trabalhadores conectados a
+        esse endereço (python main.py worker ENDEREÇO). As estatísticas de
+        cada geração vão para stats.jsonl (nada fica na memória). dashboard
+        atualiza a cada geração, em outro processo, os gráficos e a melhor
+        rede em dashboard/index.html.
+        champions > 0 desenha o campeão de cada espécie a cada champions
+        gerações em champions/ (índice em champions/index.html).
+        """
+        # Configurar NEAT
+        config = load_config(config_path)
 
-        print(f"Melhor genoma salvo! Fitness: {best_genome.fitness:.2f}")
+        # Criar população (ou retomar de um checkpoint)
+        if resume:
+            self.population = restore(resume, config)
+            num_generations = max(0, num_generations - self.population.generation)
+        else:
+            self.population = neat.Population(config)
 
-    def run_neat(self, config_path, num_generations=50):
-        """Executa o algoritmo NEAT"""
-        # Configurar NEAT
-        config = neat.config.Config(
-            neat.DefaultGenome,
-            neat.DefaultReproduction,
-            neat.DefaultSpeciesSet,
-            neat.DefaultStagnation,
-            config_path
-        )
-
-        # Criar população
-        self.population = neat.Population(config)
-
-        # Adicionar reporters para estatísticas
+        # Adicionar reporters para estatísticas: agregados de cada geração vão
+        # para stats.jsonl (ao retomar, o log continua no mesmo arquivo)
+        local = workers <= 1 and not coordinator
+        stats = StatsLog('stats.jsonl', append=bool(resume), ticks=(lambda: self.points) if local else None)
         self.population.add_reporter(neat.StdOutReporter(True))
-        stats = neat.StatisticsReporter()
         self.population.add_reporter(stats)
 
-        # Executar NEAT
-        winner = self.population.run(self.eval_genomes, num_generations)
+        # Painel ao vivo (depois do StatsLog: a geração já está no log)
+        live = None
+        if dashboard:
+            from dashboard import Dashboard
+
+            live = Dashboard(config_path, stats.path)
+            self.population.add_reporter(live)
+
+        # Diagramas dos campeões de cada espécie, desenhados em um pool
+        renderer = None
+        if champions:
+            from champions import ChampionRenderer
+
+            renderer = ChampionRenderer(config_path, interval=champions)
+            self.population.add_reporter(renderer)
+
+        # Checkpoints periódicos gravados em segundo plano
+        if checkpoint_interval:
+            checkpointer = Checkpointer(checkpoint_interval, writer=self.writer)
+            checkpointer.best_genome = self.population.best_genome
+            self.population.add_reporter(checkpointer)
+
+        # Capturas sob demanda medidas em gerações precisam dos eventos do NEAT.
+        # Com avaliação em outros processos este processo não simula: recusar
+        if workers > 1 or coordinator:
+            self.capture.unavailable = "a simulação roda em outros processos (--workers > 1 ou --coordinator)"
+        else:
+            self.population.add_reporter(self.capture)
 
-        # Salvar o melhor genoma
+        # Perfil por fase dos ticks (só na avaliação neste processo)
+        if profile:
+            if workers > 1 or coordinator:
+                print("Perfil dos ticks indisponível com --workers > 1 ou --coordinator")
+            else:
+                from profiler import TickProfiler, ProfileReporter
+
+                self.profiler = TickProfiler()
+                self.population.add_reporter(ProfileReporter(self.profiler, append=bool(resume)))
+
+        # Executar NEAT
+        evaluator = None
+        if coordinator:
+            from distributed import DistributedEvaluator
+
+            evaluator = DistributedEvaluator(config_path, coordinator, seed=self.seed,
+                                             fast_forward=self.fast_forward, max_ticks=self.max_ticks)
+            evaluate = evaluator.evaluate
+        elif workers > 1:
+            from parallel import ParallelEvaluator
+
+            evaluator = ParallelEvaluator(config, num_workers=workers, seed=self.seed,
+                                          fast_forward=self.fast_forward, max_ticks=self.max_ticks)
+            evaluate = evaluator.evaluate
+        else:
+            evaluate = self.eval_genomes
+
+        # Cache de fitness (só com semente fixa; sem ela a avaliação é aleatória)
+        if cache_size:
+            from fitness_cache import FitnessCache, CacheReporter
+
+            cache = FitnessCache(cache_size)
+            evaluate = cache.wrap(evaluate, self.seed, context=self.max_ticks)
+            if self.seed is not None:
+                self.population.add_reporter(CacheReporter(cache))
+
+        # Ticks da geração para o StatsLog: zerados antes de cada avaliação,
+        # ficam em zero quando todos os genomas vêm do cache (nada é simulado)
+        if local:
+            evaluate_generation = evaluate
+
+            def evaluate(genomes, config):
+                self.points = 0
+                evaluate_generation(genomes, config)
+
+        try:
+            winner = self.population.run(evaluate, num_generations)
+        finally:
+            stats.close()
+            if live is not None:
+                live.close()
+            if renderer is not None:
+                renderer.close()
+            if evaluator is not None:
+                evaluator.close()
+            if self.profiler is not None:
+                self.profiler.close()
+                self.profiler = None
+
+        # Salvar o melhor genoma (depois dos checkpoints pendentes)
+        self.writer.close()
         with open('winner.pkl', 'wb') as f:
             pickle.dump(winner, f)
+        # Rede podada, carregada por run_winner sem pickle e sem o neat
+        CompiledNetwork.from_genome(winner, config).save('winner.net')
 
         print(f"Melhor genoma: {winner}")
 
-        # Visualizar estatísticas
-        plot_stats(stats, ylog=False, view=True)
+        # Visualizar estatísticas (matplotlib e graphviz só são importados aqui)
+        from visualization import plot_stats, draw_neural_network
+
+        plot_stats(stats.path, ylog=False, view=True)
         draw_neural_network(config, winner, view=True)
 
         return winner
 
-    def run_winner(self, config_path, genome_path='winner.pkl'):
-        """Executa o melhor genoma"""
-        # Carregar configuração
-        config = neat.config.Config(
-            neat.DefaultGenome,
-            neat.DefaultReproduction,
-            neat.DefaultSpeciesSet,
-            neat.DefaultStagnation,
-            config_path
-        )
+    def run_winner(self, config_path, genome_path=None):
+        """Executa o melhor genoma (no modo headless, sem desenhar, só mostra a pontuação)
 
-        # Carregar genoma
-        with open(genome_path, 'rb') as f:
-            genome = pickle.load(f)
+        genome_path pode ser uma rede compilada (.net) ou um genoma em pickle;
+        sem ele vale winner.net, ou winner.pkl se a rede não foi exportada.
+        """
+        if genome_path is None:
+            genome_path = 'winner.net' if os.path.exists('winner.net') else 'winner.pkl'
 
-        # Criar rede neural
-        net = neat.nn.FeedForwardNetwork.create(genome, config)
+        if genome_path.endswith('.net'):
+            # Rede compilada: sem pickle e sem o config do NEAT
+            net = CompiledNetwork.load(genome_path)
+        else:
+            net = neat.nn.FeedForwardNetwork.create(load_genome(genome_path), load_config(config_path))
 
         # Criar dinossauro
         dinosaur = Dinosaur(self.settings.RUNNING[0], self.settings)
+        observation = Observation(self.settings)
 
         # Configuração inicial
         self.points = 0
-        self.obstacles = []
+        self.clear_obstacles()
         self.settings.game_speed = self.settings.INITIAL_GAME_SPEED
+        self.schedule = ObstacleSchedule(self.settings, self.seed)
+
+        draw = not self.headless
 
         run = True
         while run:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+            if draw:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        sys.exit()
 
-            # Limpar a tela
-            self.screen.fill((255, 255, 255))
+                # Limpar a tela
+                self.screen.fill((255, 255, 255))
 
             # Atualizar e desenhar dinossauro
             dinosaur.update()
-            dinosaur.draw(self.screen)
+            if draw:
+                dinosaur.draw(self.screen)
 
             # Gerar obstáculos
             self.generate_obstacles()
 
             # Atualizar e desenhar obstáculos
             for obstacle in list(self.obstacles):
-                obstacle.draw(self.screen)
+                if draw:
+                    obstacle.draw(self.screen)
                 obstacle.update(self.settings.game_speed)
 
                 if obstacle.rect.x < -obstacle.rect.width:
                     self.obstacles.remove(obstacle)
+                    self.obstacle_pool.release(obstacle)
 
                 # Verificar colisão
                 if dinosaur.check_collision(obstacle):
                     run = False
                     break
 
-            # Encontrar o obstáculo mais próximo
-            closest_obstacle = None
-            closest_distance = float('inf')
-
-            for obstacle in self.obstacles:
-                if obstacle.rect.x > dinosaur.rect.x:
-                    distance = obstacle.rect.x - dinosaur.rect.x
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_obstacle = obstacle
-
-            # Definir valores padrão
-            obstacle_type = 0
-            obstacle_width = 0
-            obstacle_height = 0
-            height_diff = 0
-            distance_normalized = 1.0
-            next_obstacle_distance = self.settings.SCREEN_WIDTH * 2
-            game_speed_normalized = self.settings.game_speed / self.settings.MAX_GAME_SPEED
-
-            # Se temos um obstáculo próximo
-            if closest_obstacle:
-                if isinstance(closest_obstacle, Bird):
-                    obstacle_type = 2
-                elif isinstance(closest_obstacle, LargeCactus):
-                    obstacle_type = 1
-                else:
-                    obstacle_type = 0
-
-                obstacle_width = closest_obstacle.rect.width
-                obstacle_height = closest_obstacle.rect.height
-                height_diff = dinosaur.rect.y - closest_obstacle.rect.y
-                distance_x = closest_obstacle.rect.x - dinosaur.rect.x
-
-                # Normalizar a distância
-                distance_normalized = max(0, min(1, distance_x / self.settings.SCREEN_WIDTH))
-
-                # Próximo obstáculo
-                if len(self.obstacles) > 1:
-                    next_obstacles = [o for o in self.obstacles if o.rect.x > closest_obstacle.rect.x]
-                    if next_obstacles:
-                        next_obstacle_distance = next_obstacles[0].rect.x - dinosaur.rect.x
-
-            # Ativar a rede neural
-            output = net.activate((
-                dinosaur.rect.y / self.settings.SCREEN_HEIGHT,
-                distance_normalized,
-                height_diff / self.settings.SCREEN_HEIGHT,
-                obstacle_width / self.settings.SCREEN_WIDTH,
-                obstacle_height / self.settings.SCREEN_HEIGHT,
-                obstacle_type / 2,
-                next_obstacle_distance / (self.settings.SCREEN_WIDTH * 2),
-                game_speed_normalized,
-                dinosaur.jumping / 1,
-                dinosaur.ducking / 1
-            ))
+            # Montar as entradas e ativar a rede neural
+            observation.update_obstacles(self.obstacles, dinosaur.rect.x)
+            inputs = observation.build(dinosaur.rect.y, dinosaur.jumping, dinosaur.ducking)
+            output = net.activate(inputs[0])
 
             # Executar ações baseadas na saída da rede
             if output[0] > 0.5 and dinosaur.rect.y == dinosaur.NORMAL_Y and not dinosaur.jumping:
@@ -523,17 +766,21 @@ class Game:
                 dinosaur.stop_duck()
 
             # Desenhar informações do jogo
-            score_text = self.large_font.render(f'Pontuação: {self.points}', True, (0, 0, 0))
-            speed_text = self.font.render(f'Velocidade: {self.settings.game_speed:.1f}', True, (0, 100, 0))
+            if draw:
+                score_text = self.large_font.render(f'Pontuação: {self.points}', True, (0, 0, 0))
+                speed_text = self.font.render(f'Velocidade: {self.settings.game_speed:.1f}', True, (0, 100, 0))
 
-            self.screen.blit(score_text, (self.settings.SCREEN_WIDTH // 2 - 100, 50))
-            self.screen.blit(speed_text, (self.settings.SCREEN_WIDTH // 2 - 100, 100))
+                self.screen.blit(score_text, (self.settings.SCREEN_WIDTH // 2 - 100, 50))
+                self.screen.blit(speed_text, (self.settings.SCREEN_WIDTH // 2 - 100, 100))
 
             # Atualizar pontuação
             self.points += 1
             if self.points % 100 == 0 and self.settings.game_speed < self.settings.MAX_GAME_SPEED:
                 self.settings.game_speed += 0.5
 
+            if not draw:
+                continue
+
             # Desenhar fundo
             self.draw_background()
 
@@ -541,32 +788,127 @@ class Game:
             self.clock.tick(30)
             pygame.display.update()
 
-
-# dinosaur.py - Classe do dinossauro
-# obstacles.py - Classes para os obstáculos
-# game_settings.py - Configurações do jogo
-# visualization.py - Ferramentas para visualização e estatísticas
-# Arquivo principal para executar o jogo
-if __name__ == '__main__':
-    import os
+        print(f"Pontuação final: {self.points}")
+
+
+def load_config(config_path):
+    """Carrega a configuração do NEAT"""
+    return neat.config.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        config_path
+    )
+
+
+def load_genome(genome_path):
+    """Carrega um genoma salvo com pickle (winner.pkl, best_genome.pkl)"""
+    with open(genome_path, 'rb') as f:
+        return pickle.load(f)
+
+
+def export_network(config_path, genome_path='winner.pkl', network_path=None):
+    """Poda um genoma salvo e grava a rede compilada (padrão: mesmo nome, .net)"""
+    if network_path is None:
+        network_path = os.path.splitext(genome_path)[0] + '.net'
+    net = CompiledNetwork.from_genome(load_genome(genome_path), load_config(config_path))
+    net.save(network_path)
+    print(f"Rede compilada em {network_path}: {len(net.nodes)} nós, {len(net.link_source)} conexões")
+    return network_path
+
+
+def main(argv=None):
+    """Linha de comando: python main.py [opções] [comando] [arquivo]
+
+    Comandos: train (padrão), resume CHECKPOINT, run_winner, replay GENOMA,
+    export [GENOMA] (rede compilada .net), worker ENDEREÇO (avaliação para
+    um coordenador) e bench (os argumentos restantes vão para benchmark.py).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='T-Rex Runner treinado com NEAT')
+    parser.add_argument('command', nargs='?', default='train',
+                        choices=('train', 'resume', 'run_winner', 'replay', 'export', 'worker', 'bench'),
+                        help='train (padrão), resume, run_winner, replay, export, worker ou bench')
+    parser.add_argument('path', nargs='?',
+                        help='checkpoint (resume), genoma ou rede .net (replay), genoma a exportar (export) '
+                             'ou endereço do coordenador (worker)')
+    parser.add_argument('--headless', action='store_true', help='sem janela, sem desenho e sem limite de framerate')
+    parser.add_argument('--seed', type=int, help='semente dos obstáculos (reprodutíveis)')
+    parser.add_argument('--generations', type=int, default=50, help='total de gerações do treino')
+    parser.add_argument('--workers', type=int, default=1, help='avaliação paralela em N processos')
+    parser.add_argument('--coordinator', metavar='ENDEREÇO',
+                        help='avaliação por trabalhadores remotos conectados a host:porta (padrão 127.0.0.1) '
+                             'ou unix:/caminho, autenticados pela chave em DINOPY_AUTHKEY')
+    parser.add_argument('--spectate', type=int, metavar='N', help='desenhar a cada N ticks sem limitar o framerate')
+    parser.add_argument('--top', type=int, default=10, metavar='K', help='dinossauros desenhados no modo espectador')
+    parser.add_argument('--profile', action='store_true', help='tempo de cada fase do tick por geração')
+    parser.add_argument('--fast-forward', action='store_true',
+                        help='no modo headless, avançar de uma vez os ticks sem decisões possíveis')
+    parser.add_argument('--cache', type=int, default=0, metavar='N', help='fitness de até N redes guardado (com --seed)')
+    parser.add_argument('--checkpoint', type=int, default=5, metavar='N',
+                        help='checkpoint a cada N gerações (0 desativa)')
+    parser.add_argument('--dashboard', action='store_true',
+                        help='painel atualizado a cada geração em dashboard/index.html (processo separado)')
+    parser.add_argument('--champions', type=int, default=0, metavar='N',
+                        help='desenhar o campeão de cada espécie a cada N gerações em champions/')
+    capture = parser.add_mutually_exclusive_group()
+    capture.add_argument('--capture-ticks', type=int, metavar='N',
+                         help='duração, em ticks, da captura pedida pela tecla P ou SIGUSR1')
+    capture.add_argument('--capture-generations', type=int, metavar='N',
+                         help='duração, em gerações, da captura pedida pela tecla P ou SIGUSR1')
+    args, extra = parser.parse_known_args(argv)
+
+    # Os benchmarks têm suas próprias opções e não precisam de um Game aqui
+    if args.command == 'bench':
+        import benchmark
+
+        return benchmark.main(extra)
+    if extra:
+        parser.error(f"argumentos não reconhecidos: {' '.join(extra)}")
+    if args.command in ('resume', 'replay') and not args.path:
+        parser.error(f"{args.command} precisa de um arquivo")
+
+    # O trabalhador cria seu próprio jogo headless com o config do coordenador
+    if args.command == 'worker':
+        if not args.path:
+            parser.error("worker precisa do endereço do coordenador")
+        from distributed import AUTHKEY_VARIABLE, run_worker
+
+        if not os.environ.get(AUTHKEY_VARIABLE):
+            parser.error(f"worker precisa da chave do coordenador em {AUTHKEY_VARIABLE}")
+
+        return run_worker(args.path)
+
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.txt')
+    if args.command == 'export':
+        export_network(config_path, args.path or 'winner.pkl')
+        return 0
 
     # Inicializar o jogo
-    game = Game()
+    game = Game(headless=args.headless, seed=args.seed, spectate_every=args.spectate, spectate_top=args.top)
+    game.fast_forward = args.fast_forward
+    if args.capture_generations:
+        game.capture.count, game.capture.unit = args.capture_generations, 'generations'
+    elif args.capture_ticks:
+        game.capture.count = args.capture_ticks
+
+    if args.command == 'run_winner':
+        # Executar o melhor genoma treinado
+        game.run_winner(config_path)
+    elif args.command == 'replay':
+        # Repetir um genoma salvo (por exemplo best_genome.pkl) com a semente dada
+        game.run_winner(config_path, genome_path=args.path)
+    else:
+        # Treinar novo modelo ou continuar de um checkpoint
+        game.run_neat(config_path, num_generations=args.generations, workers=args.workers,
+                      profile=args.profile, cache_size=args.cache,
+                      checkpoint_interval=args.checkpoint,
+                      resume=args.path if args.command == 'resume' else None,
+                      coordinator=args.coordinator,
+                      dashboard=args.dashboard, champions=args.champions)
 
-    # Verificar argumentos de linha de comando
-    import sys
 
-    if len(sys.argv) > 1:
-        if sys.argv[1] == 'run_winner':
-            # Executar o melhor genoma treinado
-            config_path = os.path.join(os.path.dirname(__file__), 'config.txt')
-            game.run_winner(config_path)
-        else:
-            print("Comando não reconhecido")
-            print("Uso: python main.py [run_winner]")
-            sys.exit(1)
-    else:
-        # Treinar novo modelo
-        local_dir = os.path.dirname(__file__)
-        config_path = os.path.join(local_dir, 'config.txt')
-        game.run_neat(config_path, num_generations=50)
+if __name__ == '__main__':
+    sys.exit(main())
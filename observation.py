@@ -0,0 +1,97 @@
+import numpy as np
+from obstacles import LargeCactus, Bird
+
+# Número de entradas da rede neural (num_inputs do config.txt)
+NUM_INPUTS = 10
+
+
+class Observation:
+    """Monta as entradas da rede neural para todos os dinossauros vivos
+
+    Todos os dinossauros ficam no mesmo X, então o obstáculo mais próximo e
+    o seguinte são os mesmos para a população inteira em um tick: essas
+    informações são calculadas uma vez (update_obstacles) e só altura e
+    estado de cada dinossauro variam por linha (build).
+    """
+
+    def __init__(self, settings, size=1):
+        self.settings = settings
+        # Buffer reaproveitado a cada tick (linhas = dinossauros vivos)
+        self.inputs = np.zeros((size, NUM_INPUTS))
+
+        # Informações do obstáculo mais próximo (compartilhadas)
+        self.closest_obstacle = None
+        self.distance_x = settings.SCREEN_WIDTH
+
+    def update_obstacles(self, obstacles, x_pos):
+        """Calcula as entradas que dependem apenas dos obstáculos"""
+        settings = self.settings
+
+        # Encontrar o obstáculo mais próximo à frente do dinossauro
+        closest_obstacle = None
+        closest_distance = float('inf')
+        for obstacle in obstacles:
+            if obstacle.rect.x > x_pos:
+                distance = obstacle.rect.x - x_pos
+                if distance < closest_distance:
+                    closest_distance = distance
+                    closest_obstacle = obstacle
+
+        # Definir valores padrão caso não haja obstáculos
+        obstacle_type = 0
+        obstacle_width = 0
+        obstacle_height = 0
+        distance_x = settings.SCREEN_WIDTH
+        distance_normalized = 1.0  # Normalizado entre 0 e 1
+        next_obstacle_distance = settings.SCREEN_WIDTH * 2  # Distância para o segundo obstáculo
+
+        # Se temos um obstáculo próximo, obter suas informações
+        if closest_obstacle:
+            if isinstance(closest_obstacle, Bird):
+                obstacle_type = 2
+            elif isinstance(closest_obstacle, LargeCactus):
+                obstacle_type = 1
+            else:
+                obstacle_type = 0
+
+            obstacle_width = closest_obstacle.rect.width
+            obstacle_height = closest_obstacle.rect.height
+            distance_x = closest_obstacle.rect.x - x_pos
+
+            # Normalizar a distância (ajuda a rede neural)
+            distance_normalized = max(0, min(1, distance_x / settings.SCREEN_WIDTH))
+
+            # Distância para o primeiro obstáculo além do mais próximo (se houver)
+            for obstacle in obstacles:
+                if obstacle.rect.x > closest_obstacle.rect.x:
+                    next_obstacle_distance = obstacle.rect.x - x_pos
+                    break
+
+        self.closest_obstacle = closest_obstacle
+        self.distance_x = distance_x
+
+        # Colunas compartilhadas por todos os dinossauros
+        inputs = self.inputs
+        inputs[:, 1] = distance_normalized  # Distância normalizada para o obstáculo mais próximo
+        inputs[:, 3] = obstacle_width / settings.SCREEN_WIDTH  # Largura do obstáculo normalizada
+        inputs[:, 4] = obstacle_height / settings.SCREEN_HEIGHT  # Altura do obstáculo normalizada
+        inputs[:, 5] = obstacle_type / 2  # Tipo de obstáculo normalizado (0, 0.5, ou 1)
+        inputs[:, 6] = next_obstacle_distance / (settings.SCREEN_WIDTH * 2)  # Distância para o próximo obstáculo
+        inputs[:, 7] = settings.game_speed / settings.MAX_GAME_SPEED  # Velocidade do jogo normalizada
+
+    def build(self, y, jumping, ducking):
+        """Preenche as entradas por dinossauro e devolve a matriz (len(y), NUM_INPUTS)
+
+        Aceita arrays (população) ou escalares (um único dinossauro).
+        """
+        height = self.settings.SCREEN_HEIGHT
+        inputs = self.inputs[:np.size(y)]
+
+        inputs[:, 0] = y / height  # Altura normalizada
+        if self.closest_obstacle:
+            inputs[:, 2] = (y - self.closest_obstacle.rect.y) / height  # Diferença de altura normalizada
+        else:
+            inputs[:, 2] = 0.0
+        inputs[:, 8] = jumping  # Estado atual de pulo (0 ou 1)
+        inputs[:, 9] = ducking  # Estado atual de agachamento (0 ou 1)
+        return inputs
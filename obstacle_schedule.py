@@ -0,0 +1,78 @@
+import random
+from collections import namedtuple
+from itertools import accumulate
+
+# Tipos de obstáculo
+SMALL_CACTUS = 0
+LARGE_CACTUS = 1
+BIRD = 2
+
+# Um obstáculo da sequência: tipo, variante do sprite (cactos), altura do
+# pássaro (índice em Bird.HEIGHT_OPTIONS, None para cactos) e distância extra
+# além da borda da tela
+ObstacleRecord = namedtuple('ObstacleRecord', ['kind', 'variant', 'bird_height', 'gap'])
+
+
+class ObstacleSchedule:
+    """Sequência reprodutível de obstáculos a partir de uma semente
+
+    Produz os obstáculos sob demanda, com a mesma ponderação por pontuação
+    de Game.generate_obstacles e consumindo o gerador aleatório na mesma
+    ordem, então a mesma semente gera o mesmo jogo em qualquer processo.
+    Os pesos normalizados são calculados uma vez por faixa de pontuação.
+    """
+
+    def __init__(self, settings, seed=None):
+        self.settings = settings
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Cache de (obstáculos disponíveis, pesos acumulados) por pontuação
+        self._weights = {}
+
+    def _weights_key(self, points):
+        """Pontuações com os mesmos pesos compartilham a mesma chave"""
+        if points > 1000:
+            # O modificador de chance para de crescer em 3000 pontos
+            return min(points, 3000)
+        return -1 if points >= self.settings.BIRD_INTRODUCTION_SCORE else -2
+
+    def weights(self, points):
+        """Obstáculos disponíveis e pesos acumulados para a pontuação"""
+        key = self._weights_key(points)
+        if key not in self._weights:
+            # Cactos sempre estão disponíveis; pássaros só após certa pontuação
+            available_obstacles = [SMALL_CACTUS, LARGE_CACTUS]
+            if points >= self.settings.BIRD_INTRODUCTION_SCORE:
+                available_obstacles.append(BIRD)
+
+            # Controle de frequência: mais cactos no início, mais pássaros depois
+            if points > 1000:
+                chance_modifier = min(0.4, (points - 1000) / 5000)
+                weights = [0.3 - chance_modifier / 2, 0.3 - chance_modifier / 2, 0.4 + chance_modifier]
+            else:
+                weights = [0.4, 0.4, 0.2]
+
+            # Filtrar e normalizar os pesos dos obstáculos disponíveis
+            final_weights = weights[:len(available_obstacles)]
+            total = sum(final_weights)
+            final_weights = [w / total for w in final_weights]
+
+            # Pesos acumulados: random.choices faria a mesma soma a cada sorteio
+            self._weights[key] = (available_obstacles, list(accumulate(final_weights)))
+        return self._weights[key]
+
+    def next(self, points, game_speed):
+        """Próximo obstáculo da sequência para a pontuação e velocidade atuais"""
+        available_obstacles, cum_weights = self.weights(points)
+        kind = self.rng.choices(available_obstacles, cum_weights=cum_weights, k=1)[0]
+
+        # Variante do cacto ou altura do pássaro
+        variant = self.rng.randint(0, 2)
+
+        # Distância mínima entre obstáculos baseada na velocidade
+        gap = 50 + (game_speed * 5)
+
+        if kind == BIRD:
+            return ObstacleRecord(kind, 0, variant, gap)
+        return ObstacleRecord(kind, variant, None, gap)
@@ -1,18 +1,29 @@
-import pygame
 import random
 
 
 class Obstacle:
     """Classe base para todos os obstáculos"""
 
-    def __init__(self, image_list, type_idx=0):
-        self.image_list = image_list
+    __slots__ = ('atlas', 'frames', 'type', 'rect')
+
+    def __init__(self, atlas, frames, type_idx=0):
+        # Quadros do atlas que este obstáculo pode usar
+        self.atlas = atlas
+        self.frames = frames
+        self.type = 0
+        self.rect = self.atlas.surfaces[self.frame].get_rect()
+        self.reset(type_idx)
+
+    def reset(self, type_idx=0):
+        """Prepara o obstáculo para entrar na tela (também ao sair do ObstaclePool)"""
         self.type = type_idx
-        self.rect = self.image_list[self.type].get_rect()
-        self.rect.x = 1100  # Inicialmente fora da tela
+        self.rect.size = self.atlas.sizes[self.frame]
+        self.rect.topleft = (1100, 0)  # Inicialmente fora da tela
 
-        # Cache para máscara de colisão
-        self._mask = None
+    @property
+    def frame(self):
+        """Índice do quadro atual no atlas"""
+        return self.frames[self.type]
 
     def update(self, game_speed):
         """Atualiza a posição do obstáculo baseado na velocidade do jogo"""
@@ -20,29 +31,31 @@ class Obstacle:
 
     def draw(self, screen):
         """Desenha o obstáculo na tela"""
-        screen.blit(self.image_list[self.type], self.rect)
+        screen.blit(self.atlas.surfaces[self.frame], self.rect)
 
     def get_mask(self):
         """Retorna uma máscara de colisão para detecção precisa"""
-        # Otimização: criar máscara apenas uma vez
-        if self._mask is None:
-            self._mask = pygame.mask.from_surface(self.image_list[self.type])
-        return self._mask
+        # Máscaras pré-calculadas no atlas
+        return self.atlas.masks[self.frame]
 
 
 class SmallCactus(Obstacle):
     """Classe para os cactos pequenos"""
 
-    def __init__(self, image_list, type_idx=0):
-        super().__init__(image_list, type_idx)
+    __slots__ = ()
+
+    def reset(self, type_idx=0):
+        super().reset(type_idx)
         self.rect.y = 325  # Posição Y fixa para cactos pequenos
 
 
 class LargeCactus(Obstacle):
     """Classe para os cactos grandes"""
 
-    def __init__(self, image_list, type_idx=0):
-        super().__init__(image_list, type_idx)
+    __slots__ = ()
+
+    def reset(self, type_idx=0):
+        super().reset(type_idx)
         self.rect.y = 300  # Posição Y fixa para cactos grandes
 
 
@@ -51,8 +64,13 @@ class Bird(Obstacle):
     # Alturas possíveis para os pássaros
     HEIGHT_OPTIONS = [180, 220, 260]
 
-    def __init__(self, image_list, height_type=None):
-        super().__init__(image_list, 0)  # Pássaros começam com o primeiro frame
+    __slots__ = ('step_index',)
+
+    def __init__(self, atlas, frames, height_type=None):
+        super().__init__(atlas, frames, height_type)
+
+    def reset(self, height_type=None):
+        super().reset(0)  # Pássaros começam com o primeiro frame
 
         # Determinar altura baseada no tipo ou aleatoriamente
         if height_type is not None and height_type < len(self.HEIGHT_OPTIONS):
@@ -72,10 +90,30 @@ class Bird(Obstacle):
             self.step_index = 0
             # Alternar entre os dois frames de animação
             self.type = 1 - self.type  # Alterna entre 0 e 1
-            # Reset da máscara quando a imagem muda
-            self._mask = None
 
-    def draw(self, screen):
-        """Desenha o pássaro na tela"""
-        screen.blit(self.image_list[self.type], self.rect)
 
+class ObstaclePool:
+    """Reaproveita os obstáculos que saíram da tela
+
+    Cada geração cria centenas de obstáculos; com o pool eles são
+    reinicializados com reset() em vez de recriados.
+    """
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+        # Classe -> obstáculos livres
+        self.free = {}
+
+    def acquire(self, cls, frames, variant):
+        """Um obstáculo da classe dada, reaproveitado se houver um livre"""
+        free = self.free.get(cls)
+        if free:
+            obstacle = free.pop()
+            obstacle.frames = frames
+            obstacle.reset(variant)
+            return obstacle
+        return cls(self.atlas, frames, variant)
+
+    def release(self, obstacle):
+        """Devolve ao pool um obstáculo que não está mais em jogo"""
+        self.free.setdefault(type(obstacle), []).append(obstacle)
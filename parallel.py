@@ -0,0 +1,173 @@
+import gc
+import multiprocessing
+import random
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+# Jogo headless de cada processo trabalhador (criado uma vez por processo)
+_worker_game = None
+# Geração mapeada no trabalhador: (nome do bloco, SharedMemory, redes, fitness)
+_worker_shared = None
+
+
+def _init_worker(fast_forward=False, max_ticks=None):
+    """Inicializa o jogo headless dentro do processo trabalhador"""
+    global _worker_game
+    # Importação tardia: evita import circular quando main.py roda como script
+    from main import Game
+
+    _worker_game = Game(headless=True)
+    _worker_game.fast_forward = fast_forward
+    _worker_game.max_ticks = max_ticks
+
+
+class SharedGeneration:
+    """Redes compiladas de uma geração publicadas em memória compartilhada
+
+    As matrizes de BatchNetwork (slot, ativação, bias, response, origem e
+    peso de cada camada) são copiadas uma vez para um bloco de
+    multiprocessing.shared_memory, seguidas de um vetor de fitness. Os
+    trabalhadores mapeiam o bloco sem cópia, simulam suas linhas e gravam
+    o fitness direto no vetor; nada de genomas ou Settings passa por pickle.
+    A sequência de obstáculos viaja como a semente, que a reproduz inteira
+    em cada processo (ObstacleSchedule).
+    """
+
+    def __init__(self, network, seed):
+        arrays = [array for layer in network.layers for array in layer]
+        fitness_offset = sum(array.nbytes for array in arrays)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, fitness_offset + network.size * 8))
+
+        # Descrição do bloco (pequena, vai para os trabalhadores em cada tarefa)
+        fields = []
+        offset = 0
+        for array in arrays:
+            np.ndarray(array.shape, array.dtype, buffer=self.shm.buf, offset=offset)[...] = array
+            fields.append((offset, array.shape, array.dtype.str))
+            offset += array.nbytes
+        self.layout = {
+            'name': self.shm.name,
+            'seed': seed,
+            'size': network.size,
+            'num_inputs': network.num_inputs,
+            'num_outputs': network.num_outputs,
+            'num_slots': network.num_slots,
+            'fields': fields,
+            'fitness': fitness_offset,
+        }
+        self.fitness = np.ndarray(network.size, np.float64, buffer=self.shm.buf, offset=fitness_offset)
+
+    @staticmethod
+    def attach(layout):
+        """Mapeia o bloco descrito por layout -> (SharedMemory, BatchNetwork, fitness)"""
+        from batch_network import BatchNetwork
+
+        # O resource_tracker é o do processo principal, que remove o bloco
+        shm = shared_memory.SharedMemory(name=layout['name'])
+
+        arrays = [np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)
+                  for offset, shape, dtype in layout['fields']]
+        layers = [tuple(arrays[i:i + 6]) for i in range(0, len(arrays), 6)]
+        network = BatchNetwork(layout['size'], layout['num_inputs'], layout['num_outputs'],
+                               layout['num_slots'], layers)
+        fitness = np.ndarray(layout['size'], np.float64, buffer=shm.buf, offset=layout['fitness'])
+        return shm, network, fitness
+
+    def close(self):
+        """Libera e remove o bloco (depois que todos os lotes terminaram)"""
+        self.fitness = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _release_shared():
+    """Desfaz o mapeamento da geração anterior no trabalhador"""
+    global _worker_shared
+    if _worker_shared is not None:
+        shm = _worker_shared[1]
+        # As visões do bloco precisam sumir antes de fechá-lo
+        _worker_game.net = None
+        _worker_shared = None
+        shm.close()
+
+
+def _eval_rows(args):
+    """Avalia as linhas start..stop-1 da geração publicada e grava o fitness"""
+    global _worker_shared
+    layout, start, stop = args
+    if _worker_shared is None or _worker_shared[0] != layout['name']:
+        _release_shared()
+        _worker_shared = (layout['name'],) + SharedGeneration.attach(layout)
+    _, _, network, fitness = _worker_shared
+
+    _worker_game.seed = layout['seed']
+    # Como em eval_genomes: coletor congelado só durante a simulação
+    gc.freeze()
+    try:
+        fitness[start:stop] = _worker_game.simulate(network.rows(start, stop))
+    finally:
+        gc.unfreeze()
+    return stop - start
+
+
+class ParallelEvaluator:
+    """Avalia os genomas de uma geração em um pool de processos
+
+    Cada trabalhador reconstrói a mesma sequência de obstáculos a partir da
+    semente, então o fitness não depende de como os genomas são divididos.
+    As redes são compiladas uma vez aqui e publicadas em memória
+    compartilhada (SharedGeneration); cada tarefa leva só a descrição do
+    bloco e um intervalo de linhas. Substitui Game.eval_genomes em
+    neat.Population.run:
+
+        evaluator = ParallelEvaluator(config, num_workers=8, seed=42)
+        population.run(evaluator.evaluate, 50)
+    """
+
+    def __init__(self, config, num_workers=None, seed=None, chunk_size=None, fast_forward=False,
+                 max_ticks=None):
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        # Semente fixa, ou None para sortear uma nova semente a cada geração
+        self.seed = seed
+        self.chunk_size = chunk_size
+        # Trabalhadores herdam o resource_tracker já iniciado (e não criam um
+        # próprio, que tentaria remover os blocos de memória compartilhada)
+        resource_tracker.ensure_running()
+        self.pool = multiprocessing.Pool(self.num_workers, initializer=_init_worker,
+                                         initargs=(fast_forward, max_ticks))
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Encerra o pool de processos"""
+        if getattr(self, 'pool', None) is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def split(self, size):
+        """Divide as linhas em lotes (start, stop), um ou mais por trabalhador"""
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            # Lotes menores que o necessário equilibram melhor a carga,
+            # já que alguns genomas sobrevivem muito mais que outros
+            chunk_size = max(1, size // (self.num_workers * 4))
+        return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+    def evaluate(self, genomes, config):
+        """Função de avaliação compatível com neat.Population.run"""
+        from batch_network import BatchNetwork
+
+        seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        genomes = [genome for _, genome in genomes]
+
+        generation = SharedGeneration(BatchNetwork.create(genomes, config), seed)
+        try:
+            tasks = [(generation.layout, start, stop) for start, stop in self.split(len(genomes))]
+            for _ in self.pool.imap_unordered(_eval_rows, tasks):
+                pass
+            for genome, fitness in zip(genomes, generation.fitness.tolist()):
+                genome.fitness = fitness
+        finally:
+            generation.close()
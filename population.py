@@ -0,0 +1,133 @@
+import numpy as np
+import pygame
+from collision import CollisionDetector
+
+
+def round_rect(values):
+    """Arredonda como pygame.Rect (metades para longe do zero)"""
+    rounded = np.round(values)
+    fraction = values - np.trunc(values)
+    rounded = np.where(np.abs(fraction) == 0.5, np.trunc(values) + np.sign(values), rounded)
+    return rounded.astype(np.int64)
+
+
+class DinosaurPopulation:
+    """Estado de todos os dinossauros de uma geração em arrays NumPy
+
+    Substitui uma lista de objetos Dinosaur no treinamento: cada tick avança
+    a população inteira com operações vetorizadas. A física é a mesma de
+    Dinosaur.run/jump/duck/stop_duck, inclusive o arredondamento de
+    pygame.Rect, então o fitness é idêntico ao da versão com objetos.
+    """
+
+    # Mesmas constantes de Dinosaur
+    X_POS = 80
+    NORMAL_Y = 310
+    DUCK_Y = 340
+    JUMP_VEL = 8.5
+
+    def __init__(self, size, settings):
+        self.settings = settings
+        self.size = size
+
+        # Quadros e máscaras vêm do atlas (frame guarda o índice no atlas)
+        self.atlas = settings.atlas
+        self.run_frames = np.array(settings.RUNNING_FRAMES)
+        self.duck_frames = np.array(settings.DUCKING_FRAMES)
+        self.collision = CollisionDetector(self.atlas, settings.collision_table, settings.dino_frames(), self.X_POS)
+
+        # Estado de cada dinossauro
+        self.y = np.full(size, self.NORMAL_Y, dtype=np.int64)
+        self.jump_vel = np.full(size, self.JUMP_VEL, dtype=np.float64)
+        self.step_index = np.zeros(size, dtype=np.int64)
+        self.jumping = np.zeros(size, dtype=bool)
+        self.ducking = np.zeros(size, dtype=bool)
+        self.frame = np.full(size, settings.RUNNING_FRAMES[0], dtype=np.int64)
+        self.alive = np.ones(size, dtype=bool)
+        self.fitness = np.zeros(size, dtype=np.float64)
+
+        # Cor para visualização da IA
+        self.colors = np.random.randint(0, 256, size=(size, 3))
+
+    def __len__(self):
+        """Número de dinossauros vivos"""
+        return int(np.count_nonzero(self.alive))
+
+    @property
+    def running(self):
+        # Correr, pular e agachar são estados exclusivos
+        return ~(self.jumping | self.ducking)
+
+    def alive_indices(self):
+        """Índices dos dinossauros vivos"""
+        return np.flatnonzero(self.alive)
+
+    def kill(self, index):
+        """Marca um ou mais dinossauros como mortos"""
+        self.alive[index] = False
+
+    def update(self):
+        """Atualiza o estado de todos os dinossauros vivos (Dinosaur.update)"""
+        running = self.alive & self.running
+        jumping = self.alive & self.jumping
+        ducking = self.alive & self.ducking
+
+        # Animação de corrida
+        self.frame[running] = self.run_frames[self.step_index[running] // 5]
+        self.y[running] = self.NORMAL_Y
+        self.step_index[running] += 1
+
+        if jumping.any():
+            self.jump(jumping)
+        if ducking.any():
+            self.duck(ducking)
+
+        # Garantir que o passo de animação não ultrapasse o limite
+        self.step_index[self.step_index >= 10] = 0
+
+    def jump(self, index):
+        """Avança um passo de pulo (Dinosaur.jump) para os índices dados"""
+        self.jumping[index] = True
+        self.ducking[index] = False
+        self.frame[index] = self.settings.JUMPING_FRAME
+
+        # Mesmos fatores de Dinosaur.jump, tabelados por velocidade
+        jump_multiplier, gravity_adjustment = self.settings.jump_table.factors(self.settings.game_speed)
+
+        self.y[index] = round_rect(self.y[index] - self.jump_vel[index] * jump_multiplier)
+        self.jump_vel[index] -= gravity_adjustment
+
+        # Verificar se o pulo acabou
+        landed = np.zeros(self.size, dtype=bool)
+        landed[index] = (self.jump_vel[index] <= -self.JUMP_VEL) & (self.y[index] >= self.NORMAL_Y)
+        self.y[landed] = self.NORMAL_Y
+        self.jumping[landed] = False
+        self.jump_vel[landed] = self.JUMP_VEL
+
+    def duck(self, index):
+        """Avança um passo de agachamento (Dinosaur.duck) para os índices dados"""
+        self.ducking[index] = True
+        self.jumping[index] = False
+        self.frame[index] = self.duck_frames[(self.step_index[index] // 5) % len(self.duck_frames)]
+        self.y[index] = self.DUCK_Y
+        self.step_index[index] += 1
+
+    def stop_duck(self, index):
+        """Para de agachar (Dinosaur.stop_duck) para os índices dados"""
+        self.ducking[index] = False
+        self.y[index] = self.NORMAL_Y
+
+    def check_collision(self, obstacle):
+        """Índices dos dinossauros vivos que colidem com o obstáculo"""
+        return self.collision.check(obstacle, self.frame, self.y, self.alive_indices())
+
+    def draw(self, screen):
+        """Desenha os dinossauros vivos na tela"""
+        for i in self.alive_indices():
+            image = self.atlas.surfaces[self.frame[i]]
+            screen.blit(image, (self.X_POS, int(self.y[i])))
+
+            # Para depuração visual, mostrar hitbox
+            if self.settings.DEBUG_VISUALS:
+                rect = pygame.Rect(self.X_POS, int(self.y[i]), image.get_width(), image.get_height())
+                pygame.draw.rect(screen, tuple(self.colors[i]), rect, 2)
@@ -0,0 +1,194 @@
+import gc
+import os
+import time
+import neat
+
+# Fases de um tick de eval_genomes, na ordem do relatório
+PHASES = (
+    'events',       # Leitura de eventos da janela
+    'dinosaurs',    # Física dos dinossauros
+    'obstacles',    # Geração e movimento dos obstáculos
+    'collision',    # Testes de colisão
+    'observation',  # Montagem das entradas das redes
+    'network',      # Ativação das redes e aplicação das saídas
+    'drawing',      # Dinossauros, obstáculos, HUD e fundo
+    'display',      # Envio do quadro ao display
+    'framerate',    # Espera do limite de framerate
+    'fast_forward', # Ticks sem decisões avançados de uma vez
+)
+
+
+class TickProfiler:
+    """Cronômetro por fase dos ticks de uma geração
+
+    Cada chamada a mark(fase) soma à fase o tempo desde a marca anterior,
+    então as fases cobrem o tick inteiro sem cronômetros aninhados. Quando
+    o perfil está desativado o Game guarda None no lugar do profiler e cada
+    marca custa só um teste de verdade. As coletas do coletor de lixo são
+    contadas e cronometradas à parte (gc.callbacks).
+    """
+
+    def __init__(self):
+        self.reset()
+        self.gc_started = None
+        gc.callbacks.append(self._gc_callback)
+
+    def reset(self):
+        """Zera os tempos para uma nova geração"""
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.ticks = 0
+        self.peak_alive = 0
+        self.gc_collections = 0
+        self.gc_time = 0.0
+        self.last = time.perf_counter()
+
+    def start(self):
+        """Inicia a contagem (início do laço de ticks)"""
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        """Soma à fase o tempo desde a marca anterior"""
+        now = time.perf_counter()
+        self.totals[phase] += now - self.last
+        self.last = now
+
+    def _gc_callback(self, phase, info):
+        """Cronometra cada coleta do coletor de lixo"""
+        if phase == 'start':
+            self.gc_started = time.perf_counter()
+        elif self.gc_started is not None:
+            self.gc_collections += 1
+            self.gc_time += time.perf_counter() - self.gc_started
+            self.gc_started = None
+
+    def tick(self, alive):
+        """Conta um tick com `alive` dinossauros vivos"""
+        self.ticks += 1
+        if alive > self.peak_alive:
+            self.peak_alive = alive
+
+    def close(self):
+        """Deixa de cronometrar as coletas do coletor de lixo"""
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+
+
+class ProfileReporter(neat.reporting.BaseReporter):
+    """Mostra e grava o tempo de cada fase por geração
+
+    A avaliação de uma geração acontece entre start_generation e
+    post_evaluate; o relatório é impresso junto do StdOutReporter e uma
+    linha por geração é acrescentada ao arquivo CSV. Com append (ao
+    retomar de um checkpoint) o arquivo existente continua.
+    """
+
+    def __init__(self, profiler, path='tick_profile.csv', append=False):
+        self.profiler = profiler
+        self.path = path
+        self.generation = None
+
+        if append and os.path.exists(self.path) and os.path.getsize(self.path):
+            return
+        with open(self.path, 'w') as f:
+            f.write(','.join(('generation', 'ticks', 'peak_alive', 'total') + PHASES
+                             + ('gc_collections', 'gc_time')) + '\n')
+
+    def start_generation(self, generation):
+        self.generation = generation
+        self.profiler.reset()
+
+    def post_evaluate(self, config, population, species, best_genome):
+        profiler = self.profiler
+        total = sum(profiler.totals.values())
+
+        print(f"Perfil do tick: {profiler.ticks} ticks, pico de {profiler.peak_alive} vivos, {total:.3f}s")
+        for phase in PHASES:
+            seconds = profiler.totals[phase]
+            if seconds == 0:
+                continue
+            share = seconds / total if total else 0.0
+            per_tick = seconds / profiler.ticks * 1e6 if profiler.ticks else 0.0
+            print(f"    {phase:<12} {seconds:8.3f}s {share:6.1%} {per_tick:9.1f} us/tick")
+        print(f"    Coletor de lixo: {profiler.gc_collections} coletas, {profiler.gc_time:.3f}s")
+
+        values = [self.generation, profiler.ticks, profiler.peak_alive, total]
+        values += [profiler.totals[phase] for phase in PHASES]
+        values += [profiler.gc_collections, profiler.gc_time]
+        with open(self.path, 'a') as f:
+            f.write(','.join(str(value) for value in values) + '\n')
+
+
+class ProfileCapture(neat.reporting.BaseReporter):
+    """Captura com cProfile do processo em execução, sob demanda
+
+    request() (tecla P ou SIGUSR1) só marca o pedido, então pode ser chamado
+    de um tratador de sinal. A captura começa no próximo tick (ou na próxima
+    geração) e dura `count` ticks ou gerações, conforme `unit`; o resultado
+    é gravado em um arquivo pstats com o número da geração em que começou.
+    """
+
+    def __init__(self, count=1000, unit='ticks', prefix='profile'):
+        self.count = count
+        self.unit = unit
+        self.prefix = prefix
+
+        self.pending = False
+        self.profile = None
+        self.remaining = 0
+        self.generation = 0
+        self.path = None
+        # Motivo para recusar pedidos (a simulação roda em outros processos)
+        self.unavailable = None
+
+    def request(self, *args):
+        """Pede uma captura (aceita os argumentos de um tratador de sinal)"""
+        if self.unavailable:
+            print(f"Captura de perfil indisponível: {self.unavailable}")
+            return
+        self.pending = True
+
+    def start(self, generation, tick=None):
+        """Inicia o cProfile e escolhe o nome do arquivo"""
+        import cProfile
+
+        self.pending = False
+        self.remaining = self.count
+        self.generation = generation
+        name = f'{self.prefix}_gen{generation}'
+        if tick is not None:
+            name += f'_tick{tick}'
+        self.path = name + '.pstats'
+        print(f"Capturando perfil: {self.count} {'ticks' if self.unit == 'ticks' else 'gerações'}")
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        """Encerra a captura, grava o arquivo e mostra as funções mais caras"""
+        import pstats
+
+        self.profile.disable()
+        self.profile.dump_stats(self.path)
+        print(f"Perfil salvo em {self.path}")
+        pstats.Stats(self.profile).sort_stats('cumulative').print_stats(15)
+        self.profile = None
+
+    def tick(self, generation, tick):
+        """Chamado a cada tick enquanto há pedido ou captura em andamento"""
+        if self.unit != 'ticks':
+            return
+        if self.profile is None:
+            self.start(generation, tick)
+            return
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.stop()
+
+    def start_generation(self, generation):
+        if self.unit == 'generations' and self.pending and self.profile is None:
+            self.start(generation)
+
+    def end_generation(self, config, population, species_set):
+        if self.unit == 'generations' and self.profile is not None:
+            self.remaining -= 1
+            if self.remaining <= 0:
+                self.stop()
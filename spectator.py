@@ -0,0 +1,95 @@
+import numpy as np
+import pygame
+
+BACKGROUND_COLOR = (255, 255, 255)
+TEXT_COLOR = (0, 0, 0)
+
+
+class Spectator:
+    """Acompanhar o treinamento sem desacelerar a simulação
+
+    A simulação roda sem limite de framerate e a tela só é desenhada a cada
+    `every` ticks. Só os `top_k` dinossauros vivos com maior fitness são
+    desenhados, e dinossauros no mesmo estado (quadro, y) são desenhados uma
+    única vez. Os textos do HUD só são renderizados quando o valor muda, e
+    apenas as regiões alteradas da tela são enviadas ao display.
+    """
+
+    def __init__(self, screen, settings, font, bg_image, y_pos_bg, every=10, top_k=10):
+        self.screen = screen
+        self.settings = settings
+        self.font = font
+        self.bg_image = bg_image
+        self.y_pos_bg = y_pos_bg
+        self.every = max(1, every)
+        self.top_k = top_k
+
+        self.x_pos_bg = 0
+        self.ticks = 0
+
+        # Regiões desenhadas no quadro anterior (apagadas no próximo)
+        self.dirty = []
+
+        # Cache dos textos do HUD: posição -> (texto, superfície)
+        self.text_cache = {}
+
+        self.screen.fill(BACKGROUND_COLOR)
+        pygame.display.update()
+
+    def due(self):
+        """Conta um tick e diz se este tick deve ser desenhado"""
+        self.ticks += 1
+        return self.ticks % self.every == 0
+
+    def text(self, position, text):
+        """Desenha um texto do HUD, renderizando-o só quando muda"""
+        cached = self.text_cache.get(position)
+        if cached is None or cached[0] != text:
+            cached = (text, self.font.render(text, True, TEXT_COLOR))
+            self.text_cache[position] = cached
+        return self.screen.blit(cached[1], position)
+
+    def render(self, game):
+        """Desenha o estado atual do jogo nas regiões alteradas da tela"""
+        screen = self.screen
+        atlas = self.settings.atlas
+
+        # Apagar o que foi desenhado no quadro anterior
+        for rect in self.dirty:
+            screen.fill(BACKGROUND_COLOR, rect)
+        drawn = []
+
+        # Fundo em movimento (avança o que andou desde o último quadro)
+        image_width = self.bg_image.get_width()
+        self.x_pos_bg -= self.settings.game_speed * self.every
+        if self.x_pos_bg <= -image_width:
+            self.x_pos_bg %= -image_width
+        drawn.append(screen.blit(self.bg_image, (self.x_pos_bg, self.y_pos_bg)))
+        drawn.append(screen.blit(self.bg_image, (image_width + self.x_pos_bg, self.y_pos_bg)))
+
+        # Obstáculos
+        for obstacle in game.obstacles:
+            drawn.append(screen.blit(atlas.surfaces[obstacle.frame], obstacle.rect))
+
+        # Os K dinossauros vivos com maior fitness, um desenho por estado
+        dinosaurs = game.dinosaurs
+        alive = dinosaurs.alive_indices()
+        if len(alive) > self.top_k:
+            alive = alive[np.argpartition(dinosaurs.fitness[alive], -self.top_k)[-self.top_k:]]
+        states = set(zip(dinosaurs.frame[alive].tolist(), dinosaurs.y[alive].tolist()))
+        for frame, y in states:
+            drawn.append(screen.blit(atlas.surfaces[frame], (dinosaurs.X_POS, y)))
+
+        # HUD
+        alive_fitness = dinosaurs.fitness[dinosaurs.alive]
+        highest_fitness = alive_fitness.max() if len(alive_fitness) else 0
+        generation = game.population.generation + 1 if game.population else 1
+        drawn.append(self.text((50, 450), f'Dinossauros Vivos: {len(alive_fitness)}'))
+        drawn.append(self.text((50, 480), f'Geração: {generation}'))
+        drawn.append(self.text((50, 510), f'Velocidade: {self.settings.game_speed:.1f}'))
+        drawn.append(self.text((50, 540), f'Maior Fitness: {highest_fitness:.2f}'))
+        drawn.append(self.text((950, 50), f'Pontos: {game.points}'))
+
+        # Enviar ao display só as regiões antigas e novas
+        pygame.display.update(self.dirty + drawn)
+        self.dirty = drawn
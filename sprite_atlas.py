@@ -0,0 +1,34 @@
+import pygame
+
+
+class SpriteAtlas:
+    """Quadros do jogo com máscaras e caixas delimitadoras pré-calculadas
+
+    Construído uma vez em Settings.load_images. Dinossauros e obstáculos
+    guardam apenas o índice do quadro, então nenhuma máscara é criada
+    durante uma geração. Os dados são tuplas e não devem ser alterados.
+    """
+
+    def __init__(self, surfaces):
+        self.surfaces = tuple(surfaces)
+        self.masks = tuple(pygame.mask.from_surface(surface) for surface in self.surfaces)
+        self.sizes = tuple(surface.get_size() for surface in self.surfaces)
+
+        # Caixa (x, y, largura, altura) dos pixels opacos de cada quadro,
+        # relativa ao canto do sprite
+        self.bounds = tuple(self._opaque_bounds(mask) for mask in self.masks)
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    @staticmethod
+    def _opaque_bounds(mask):
+        """Caixa que contém todos os pixels opacos da máscara"""
+        rects = mask.get_bounding_rects()
+        if not rects:
+            return (0, 0, 0, 0)
+        return tuple(rects[0].unionall(rects[1:]))
+
+    def indices(self, surfaces):
+        """Índices que os quadros dados ocupam no atlas"""
+        return tuple(self.surfaces.index(surface) for surface in surfaces)
@@ -0,0 +1,90 @@
+import json
+import os
+import time
+import neat
+import numpy as np
+
+
+class StatsLog(neat.reporting.BaseReporter):
+    """Estatísticas por geração gravadas em um log JSONL só de acréscimo
+
+    Substitui neat.StatisticsReporter, que guarda uma cópia do melhor
+    genoma e a lista de fitness de todas as gerações. Aqui cada geração vira
+    uma linha com agregados (melhor, média, desvio padrão e mínimo do
+    fitness, tamanho de cada espécie, ticks simulados e tempo de relógio)
+    e nada fica na memória.
+
+    Ao retomar de um checkpoint o log continua no mesmo arquivo; gerações
+    repetidas são resolvidas pela leitura (StatsLogReader), onde vale a
+    última linha de cada geração.
+    """
+
+    def __init__(self, path='stats.jsonl', append=False, ticks=None):
+        self.path = path
+        # Função que retorna os ticks simulados na geração (None se desconhecidos)
+        self.ticks = ticks
+
+        self.file = open(path, 'a' if append else 'w', buffering=1)
+        self.generation = None
+        self.started = None
+
+    def start_generation(self, generation):
+        self.generation = generation
+        self.started = time.perf_counter()
+
+    def post_evaluate(self, config, population, species, best_genome):
+        fitness = np.array([genome.fitness for genome in population.values()], dtype=float)
+        record = {
+            'generation': self.generation,
+            'best': float(fitness.max()),
+            'mean': float(fitness.mean()),
+            'stdev': float(fitness.std()),
+            'min': float(fitness.min()),
+            'population': len(fitness),
+            'species': [[sid, len(s.members)] for sid, s in sorted(species.species.items())],
+            'ticks': self.ticks() if self.ticks else None,
+            'seconds': round(time.perf_counter() - self.started, 6),
+        }
+        self.file.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def close(self):
+        """Fecha o arquivo do log"""
+        if not self.file.closed:
+            self.file.close()
+
+
+class StatsLogReader:
+    """Leitura incremental de um log de StatsLog
+
+    Cada chamada a read() lê só as linhas escritas desde a anterior (uma
+    linha ainda incompleta fica para a próxima), então o log pode ser
+    acompanhado enquanto o treino roda. Os registros lidos ficam em
+    `records` por geração, valendo a última linha de cada uma.
+    """
+
+    def __init__(self, path='stats.jsonl'):
+        self.path = path
+        self.offset = 0
+        self.records = {}
+
+    def read(self):
+        """Registros novos desde a última leitura, na ordem do arquivo"""
+        if not os.path.exists(self.path):
+            return []
+        new = []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Linha ainda sendo escrita
+                self.offset += len(line)
+                if line.strip():
+                    record = json.loads(line)
+                    self.records[record['generation']] = record
+                    new.append(record)
+        return new
+
+    def generations(self):
+        """Todas as gerações lidas até agora, em ordem (lê o que for novo antes)"""
+        self.read()
+        return [self.records[generation] for generation in sorted(self.records)]
@@ -0,0 +1,150 @@
+import numpy as np
+from population import round_rect
+
+
+class JumpTable:
+    """Tabelas pré-calculadas do pulo para cada velocidade do jogo
+
+    A velocidade só muda em passos de 0.1 de INITIAL_GAME_SPEED até
+    MAX_GAME_SPEED, então há poucas velocidades possíveis. Para cada uma
+    guardamos os fatores de Dinosaur.jump (multiplicador do pulo e
+    gravidade) e o arco completo de um pulo a partir do chão: a altura em
+    cada tick e o tempo no ar.
+
+    O arco supõe velocidade constante durante o pulo, o que é exato na
+    velocidade máxima; antes dela a velocidade sobe 0.1 a cada 10 ticks e
+    o arco real pode diferir um pouco. Por isso a física da população
+    só usa os fatores (exatos) e o arco serve às consultas de clears().
+    """
+
+    # Mesmas constantes de Dinosaur
+    X_POS = 80
+    NORMAL_Y = 310
+    JUMP_VEL = 8.5
+
+    def __init__(self, settings):
+        self.settings = settings
+
+        # Velocidades na mesma sequência de Game.update_score (inclusive o
+        # erro acumulado de ponto flutuante)
+        speeds = [float(settings.INITIAL_GAME_SPEED)]
+        while speeds[-1] < settings.MAX_GAME_SPEED:
+            speeds.append(speeds[-1] + 0.1)
+        self.speeds = np.array(speeds)
+        self.bucket_of = {speed: i for i, speed in enumerate(speeds)}
+
+        # Fatores de cada velocidade (velocidade -> (multiplicador, gravidade))
+        self._factors = {}
+        self.multiplier = np.empty(len(speeds))
+        self.gravity = np.empty(len(speeds))
+        for i, speed in enumerate(speeds):
+            self.multiplier[i], self.gravity[i] = self.factors(speed)
+
+        self.trajectories, self.airtime = self._build_trajectories()
+
+        # Cache das consultas de clears(): chave -> dx que passam pelo obstáculo
+        self._clears = {}
+
+    def factors(self, game_speed):
+        """Multiplicador do pulo e ajuste da gravidade (Dinosaur.jump)"""
+        factors = self._factors.get(game_speed)
+        if factors is None:
+            base_speed = self.settings.INITIAL_GAME_SPEED
+            speed_ratio = game_speed / base_speed
+            speed_factor = 1 + (speed_ratio - 1) * 0.3
+            jump_multiplier = 4 * min(speed_factor, 2)
+            base_gravity = 0.8
+            gravity_adjustment = base_gravity * (1 + (speed_factor - 1) * 0.4)
+            factors = self._factors[game_speed] = (jump_multiplier, gravity_adjustment)
+        return factors
+
+    def _build_trajectories(self):
+        """Altura a cada tick de um pulo a partir do chão, todas as velocidades juntas"""
+        count = len(self.speeds)
+        y = np.full(count, self.NORMAL_Y, dtype=np.int64)
+        velocity = np.full(count, self.JUMP_VEL)
+        airtime = np.zeros(count, dtype=np.int64)
+        jumping = np.ones(count, dtype=bool)
+
+        heights = []
+        while jumping.any():
+            # Um passo de DinosaurPopulation.jump para quem ainda está no ar
+            y[jumping] = round_rect(y[jumping] - velocity[jumping] * self.multiplier[jumping])
+            velocity[jumping] -= self.gravity[jumping]
+            airtime[jumping] += 1
+
+            landed = jumping & (velocity <= -self.JUMP_VEL) & (y >= self.NORMAL_Y)
+            y[landed] = self.NORMAL_Y
+            jumping &= ~landed
+            heights.append(y.copy())
+
+        # Linha = velocidade, coluna = tick do pulo (após o fim, no chão)
+        return np.stack(heights, axis=1), airtime
+
+    def bucket(self, game_speed):
+        """Índice da velocidade na tabela (a mais próxima, se fora da sequência)"""
+        index = self.bucket_of.get(game_speed)
+        if index is None:
+            index = int(np.abs(self.speeds - game_speed).argmin())
+        return index
+
+    def trajectory(self, game_speed):
+        """Alturas de um pulo iniciado agora, do primeiro tick até o pouso"""
+        index = self.bucket(game_speed)
+        return self.trajectories[index, :self.airtime[index]]
+
+    def clears(self, game_speed, obstacle):
+        """Um pulo iniciado agora passa pelo obstáculo sem colidir?
+
+        Verdadeiro se nenhum tick do pulo colide e, no pouso, o obstáculo já
+        ficou para trás. A resposta para cada (velocidade, quadro e altura
+        do obstáculo) é calculada uma vez para todas as distâncias; depois
+        cada consulta é uma indexação.
+        """
+        index = self.bucket(game_speed)
+        step_index = getattr(obstacle, 'step_index', None)
+        key = (index, obstacle.frames, obstacle.type, step_index, obstacle.rect.y)
+        cleared = self._clears.get(key)
+        if cleared is None:
+            cleared = self._clears[key] = self._clears_by_distance(index, obstacle, step_index)
+
+        offset, passed = cleared
+        dx = obstacle.rect.x - self.X_POS + offset
+        if dx < 0:
+            return True  # Obstáculo já atrás do dinossauro
+        if dx >= len(passed):
+            return False  # Longe demais: o pulo acaba antes de alcançá-lo
+        return bool(passed[dx])
+
+    def _clears_by_distance(self, index, obstacle, step_index):
+        """Para cada distância inicial, se o pulo passa pelo obstáculo"""
+        settings = self.settings
+        atlas = settings.atlas
+        speed = self.speeds[index]
+        heights = self.trajectories[index, :self.airtime[index]]
+
+        # Distâncias iniciais consideradas (obstáculo - dinossauro)
+        offset = 300
+        dx = np.arange(-offset, settings.SCREEN_WIDTH + 700)
+        hit = np.zeros(len(dx), dtype=bool)
+
+        kind, frame_type = obstacle.frames, obstacle.type
+        x = dx.copy()
+        for y in heights[1:]:
+            # Movimento e animação de Obstacle.update/Bird.update
+            x = round_rect(x - speed)
+            if step_index is not None:
+                step_index += 1
+                if step_index >= 10:
+                    step_index = 0
+                    frame_type = 1 - frame_type
+            frame = kind[frame_type]
+            hit |= settings.collision_table.lookup(
+                settings.JUMPING_FRAME, frame, x, obstacle.rect.y - y
+            )
+
+        # No pouso o obstáculo precisa ter passado pelo dinossauro
+        bx, by, bw, bh = atlas.bounds[kind[frame_type]]
+        dino_left = self.X_POS + min(atlas.bounds[frame][0] for frame in settings.dino_frames())
+        behind = self.X_POS + x + bx + bw <= dino_left
+        return offset, ~hit & behind
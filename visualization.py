@@ -1,19 +1,30 @@
+import warnings
 import matplotlib.pyplot as plt
 import numpy as np
 import graphviz
 import neat
+from stats_log import StatsLogReader
 
 
-def plot_stats(statistics, ylog=False, view=False, filename='neat-stats.svg'):
-    """Plot the population's average and best fitness."""
+def _records(source):
+    """Gerações de um log de StatsLog (caminho ou StatsLogReader já aberto)"""
+    # Leitura linha a linha do log; só os agregados de cada geração ficam na
+    # memória. Com um leitor já aberto, só as linhas novas são lidas.
+    reader = source if isinstance(source, StatsLogReader) else StatsLogReader(source)
+    return reader.generations()
+
+
+def plot_stats(path='stats.jsonl', ylog=False, view=False, filename='neat-stats.svg'):
+    """Plot the population's average and best fitness (from a StatsLog file)."""
     if plt is None:
         warnings.warn("This display is not available due to a missing optional dependency (matplotlib)")
         return
 
-    generation = range(len(statistics.most_fit_genomes))
-    best_fitness = [c.fitness for c in statistics.most_fit_genomes]
-    avg_fitness = np.array(statistics.get_fitness_mean())
-    stdev_fitness = np.array(statistics.get_fitness_stdev())
+    records = _records(path)
+    generation = [r['generation'] for r in records]
+    best_fitness = [r['best'] for r in records]
+    avg_fitness = np.array([r['mean'] for r in records])
+    stdev_fitness = np.array([r['stdev'] for r in records])
 
     plt.figure(figsize=(12, 8))
     plt.plot(generation, avg_fitness, 'b-', label="average")
@@ -36,6 +47,36 @@ def plot_stats(statistics, ylog=False, view=False, filename='neat-stats.svg'):
     plt.close()
 
 
+def plot_species(path='stats.jsonl', view=False, filename='speciation.svg'):
+    """Visualizes speciation throughout evolution (from a StatsLog file)."""
+    if plt is None:
+        warnings.warn("This display is not available due to a missing optional dependency (matplotlib)")
+        return
+
+    records = _records(path)
+    generation = [r['generation'] for r in records]
+    species_ids = sorted({sid for r in records for sid, _ in r['species']})
+    curves = np.zeros((len(species_ids), len(records)))
+    row = {sid: i for i, sid in enumerate(species_ids)}
+    for column, r in enumerate(records):
+        for sid, size in r['species']:
+            curves[row[sid], column] = size
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    if len(species_ids):
+        ax.stackplot(generation, *curves)
+
+    plt.title("Speciation")
+    plt.ylabel("Size per Species")
+    plt.xlabel("Generations")
+
+    plt.savefig(filename)
+    if view:
+        plt.show()
+
+    plt.close()
+
+
 def draw_neural_network(config, genome, view=False, filename='network.gv', node_names=None):
     """Visualizar a rede neural"""
     if graphviz is None: